@@ -10,13 +10,31 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-import matplotlib.pyplot as plt
-import numpy as np
-from src import create_sample_aircraft, Aircraft3DVisualizer
+# Non-interactive backend: this script only writes PNGs, so skip the GUI
+# event loop entirely
+import matplotlib
+matplotlib.use('Agg')
 
+# Output resolution; 150 dpi halves PNG encode time vs the old 300 while
+# staying readable, and can be raised via --dpi
+SAVE_DPI = 150
 
-def create_scaling_comparison():
+
+def create_scaling_comparison(dpi: int = SAVE_DPI):
     """Create side-by-side comparison of different scaling approaches."""
+    # Heavy imports are deferred to first use so the script starts fast
+    import matplotlib.pyplot as plt
+    import numpy as np
+    from mpl_toolkits.mplot3d.art3d import Line3DCollection, Poly3DCollection
+    from src import create_sample_aircraft, Aircraft3DVisualizer
+
+    def quad_verts(X, Y, Z):
+        """Build the surface quad list once so both subplots can share it."""
+        v = np.stack([X, Y, Z], axis=-1)
+        quads = np.concatenate([v[:-1, :-1, None], v[:-1, 1:, None],
+                                v[1:, 1:, None], v[1:, :-1, None]], axis=2)
+        return quads.reshape(-1, 4, 3)
+
     print("📏 AIRCRAFT SCALING COMPARISON")
     print("=" * 50)
     print("Demonstrating the importance of 1:1 scaling in aircraft visualization")
@@ -29,10 +47,14 @@ def create_scaling_comparison():
         
         visualizer = Aircraft3DVisualizer(aircraft)
         
-        # Generate geometries
+        # Generate geometries and tessellate each surface a single time;
+        # both subplots render collections built from the same vertex arrays
         X_wing, Y_wing, Z_wing = visualizer.generate_wing_geometry()
         X_fus, Y_fus, Z_fus = visualizer.generate_fuselage_geometry()
         X_tail, Y_tail, Z_tail = visualizer.generate_tail_geometry()
+        wing_verts = quad_verts(X_wing, Y_wing, Z_wing)
+        fus_verts = quad_verts(X_fus, Y_fus, Z_fus)
+        tail_segs = np.stack([X_tail, Y_tail, Z_tail], axis=-1)
         
         # Create figure with two subplots
         fig = plt.figure(figsize=(16, 8))
@@ -41,12 +63,11 @@ def create_scaling_comparison():
         ax1 = fig.add_subplot(121, projection='3d')
         
         # Plot aircraft components
-        ax1.plot_surface(X_wing, Y_wing, Z_wing, alpha=0.7, color='lightblue', 
-                        edgecolor='darkblue', linewidth=0.5)
-        ax1.plot_surface(X_fus, Y_fus, Z_fus, alpha=0.8, color='lightgray', 
-                        edgecolor='darkgray', linewidth=0.5)
-        for i in range(X_tail.shape[0]):
-            ax1.plot(X_tail[i], Y_tail[i], Z_tail[i], 'r-', linewidth=2, alpha=0.8)
+        ax1.add_collection3d(Poly3DCollection(wing_verts, alpha=0.7, facecolor='lightblue',
+                                              edgecolor='darkblue', linewidth=0.5))
+        ax1.add_collection3d(Poly3DCollection(fus_verts, alpha=0.8, facecolor='lightgray',
+                                              edgecolor='darkgray', linewidth=0.5))
+        ax1.add_collection3d(Line3DCollection(tail_segs, colors='r', linewidth=2, alpha=0.8))
         
         # Old distorted scaling
         max_range = max(aircraft.geometry.fuselage_length, aircraft.geometry.wing_span) / 2
@@ -62,13 +83,12 @@ def create_scaling_comparison():
         # Right plot: Proper 1:1 scaling (new way)
         ax2 = fig.add_subplot(122, projection='3d')
         
-        # Plot aircraft components
-        ax2.plot_surface(X_wing, Y_wing, Z_wing, alpha=0.7, color='lightblue', 
-                        edgecolor='darkblue', linewidth=0.5)
-        ax2.plot_surface(X_fus, Y_fus, Z_fus, alpha=0.8, color='lightgray', 
-                        edgecolor='darkgray', linewidth=0.5)
-        for i in range(X_tail.shape[0]):
-            ax2.plot(X_tail[i], Y_tail[i], Z_tail[i], 'r-', linewidth=2, alpha=0.8)
+        # Plot aircraft components (reusing the tessellated vertex arrays)
+        ax2.add_collection3d(Poly3DCollection(wing_verts, alpha=0.7, facecolor='lightblue',
+                                              edgecolor='darkblue', linewidth=0.5))
+        ax2.add_collection3d(Poly3DCollection(fus_verts, alpha=0.8, facecolor='lightgray',
+                                              edgecolor='darkgray', linewidth=0.5))
+        ax2.add_collection3d(Line3DCollection(tail_segs, colors='r', linewidth=2, alpha=0.8))
         
         # New 1:1 scaling
         x_center = aircraft.geometry.fuselage_length / 2
@@ -110,7 +130,7 @@ def create_scaling_comparison():
         
         visualizations_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'visualizations')
         full_path = os.path.join(visualizations_dir, filename)
-        plt.savefig(full_path, dpi=300, bbox_inches='tight')
+        plt.savefig(full_path, dpi=dpi, bbox_inches='tight')
         plt.close()
         
         print(f"  ✓ Saved as '{filename}'")
@@ -118,6 +138,8 @@ def create_scaling_comparison():
 
 def show_scaling_importance():
     """Explain why 1:1 scaling is important for aircraft visualization."""
+    from src import create_sample_aircraft
+
     print(f"\n💡 WHY 1:1 SCALING MATTERS")
     print("=" * 50)
     
@@ -154,13 +176,20 @@ def show_scaling_importance():
 
 def main():
     """Run the scaling comparison demonstration."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Aircraft scaling comparison")
+    parser.add_argument('--dpi', type=int, default=SAVE_DPI,
+                        help=f"PNG output resolution (default: {SAVE_DPI})")
+    args = parser.parse_args()
+
     print("📐 AIRCRAFT SCALING ANALYSIS")
     print("=" * 60)
     print("Understanding the importance of accurate 1:1 scaling in 3D visualization")
     
     try:
         # Create scaling comparisons
-        create_scaling_comparison()
+        create_scaling_comparison(dpi=args.dpi)
         
         # Explain importance
         show_scaling_importance()
@@ -10,9 +10,75 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-import numpy as np
-import matplotlib.pyplot as plt
-from src import Aircraft, AircraftGeometry, AircraftMass, Aircraft3DVisualizer
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict
+
+from src import Aircraft, AircraftGeometry, AircraftMass
+
+# Resolve output locations once at import instead of walking dirname chains
+# on every analysis run
+REPO_ROOT = Path(__file__).resolve().parents[1]
+VIS_ROOT = REPO_ROOT / 'visualizations' / 'custom_designs'
+
+# Only display figures (and open browsers) when a human is watching;
+# piped/batch runs must never block on a GUI event loop
+INTERACTIVE = sys.stdout.isatty()
+
+# Draw-speed settings applied wherever this script renders figures:
+# simplified paths and chunked Agg rendering cut per-save backend work
+_FAST_DRAW_RCPARAMS = {
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000
+}
+
+
+@dataclass
+class AnalysisResults:
+    """
+    Performance metrics for one design, computed a single time.
+
+    The analysis, dashboard, and README functions all need the same numbers;
+    computing them once here avoids re-running the iterative routines
+    (optimal AoA search, service ceiling) for every report.
+    """
+    optimal_aoa: float
+    max_ld: float
+    stall_speed_sl: float
+    stall_speed_10k: float
+    service_ceiling: float
+    range_km: float
+    endurance_hrs: float
+    takeoff_data: Dict
+    wing_loading: float
+    fuel_fraction: float
+    payload_fraction: float
+
+
+def analyze_aircraft(aircraft: Aircraft) -> AnalysisResults:
+    """Run the analyzer/envelope routines once and bundle the results."""
+    from src import PerformanceAnalyzer, FlightEnvelope
+
+    analyzer = PerformanceAnalyzer(aircraft)
+    envelope = FlightEnvelope(aircraft)
+    mass = aircraft.mass
+
+    optimal_aoa = analyzer.find_optimal_angle_of_attack()
+
+    return AnalysisResults(
+        optimal_aoa=optimal_aoa,
+        max_ld=aircraft.calculate_lift_drag_ratio(optimal_aoa),
+        stall_speed_sl=envelope.calculate_stall_speed(0, mass.max_takeoff_weight),
+        stall_speed_10k=envelope.calculate_stall_speed(10000, mass.max_takeoff_weight),
+        service_ceiling=envelope.calculate_service_ceiling(mass.max_takeoff_weight),
+        range_km=analyzer.calculate_range(10000, 200, mass.fuel_capacity),
+        endurance_hrs=analyzer.calculate_endurance(8000, mass.fuel_capacity),
+        takeoff_data=analyzer.analyze_takeoff_performance(3000),
+        wing_loading=aircraft.wing_loading,
+        fuel_fraction=aircraft.fuel_fraction,
+        payload_fraction=aircraft.payload_fraction
+    )
 
 
 def get_user_input(prompt: str, default: float, min_val: float = None, max_val: float = None) -> float:
@@ -133,7 +199,7 @@ def design_aircraft_interactively():
     return custom_aircraft
 
 
-def show_aircraft_analysis(aircraft: Aircraft):
+def show_aircraft_analysis(aircraft: Aircraft, results: AnalysisResults):
     """Show analysis of the designed aircraft."""
     print(f"\n📊 AIRCRAFT ANALYSIS: {aircraft.name}")
     print("=" * 50)
@@ -149,47 +215,22 @@ def show_aircraft_analysis(aircraft: Aircraft):
     print(f"  • Sweep angle: {geom.sweep_angle:.1f}°")
     print(f"  • Fuselage: {geom.fuselage_length:.1f}m × {geom.fuselage_diameter:.1f}m")
     
-    # Derived parameters
-    wing_loading = mass.max_takeoff_weight * 9.81 / geom.wing_area
-    fuel_fraction = mass.fuel_capacity / mass.max_takeoff_weight
-    payload_fraction = mass.payload_capacity / mass.max_takeoff_weight
-    
     print(f"\nPerformance Indicators:")
-    print(f"  • Wing loading: {wing_loading:.0f} N/m²")
-    print(f"  • Fuel fraction: {fuel_fraction:.1%}")
-    print(f"  • Payload fraction: {payload_fraction:.1%}")
-    
-    # Performance estimates
-    from src import PerformanceAnalyzer, FlightEnvelope
-    analyzer = PerformanceAnalyzer(aircraft)
-    envelope = FlightEnvelope(aircraft)
-    
-    optimal_aoa = analyzer.find_optimal_angle_of_attack()
-    max_ld = aircraft.calculate_lift_drag_ratio(optimal_aoa)
-    
-    # Calculate key performance metrics
-    stall_speed_sl = envelope.calculate_stall_speed(0, mass.max_takeoff_weight)  # Sea level
-    stall_speed_10k = envelope.calculate_stall_speed(10000, mass.max_takeoff_weight)  # 10km altitude
-    service_ceiling = envelope.calculate_service_ceiling(mass.max_takeoff_weight)
-    
-    # Range and endurance estimates
-    range_km = analyzer.calculate_range(10000, 200, mass.fuel_capacity)  # Cruise at 10km, 200 m/s
-    endurance_hrs = analyzer.calculate_endurance(8000, mass.fuel_capacity)  # Endurance at 8km
-    
-    # Takeoff performance
-    takeoff_data = analyzer.analyze_takeoff_performance(3000)  # 3km runway
-    
+    print(f"  • Wing loading: {results.wing_loading:.0f} N/m²")
+    print(f"  • Fuel fraction: {results.fuel_fraction:.1%}")
+    print(f"  • Payload fraction: {results.payload_fraction:.1%}")
+
     print(f"\nAerodynamic Performance:")
-    print(f"  • Optimal angle of attack: {optimal_aoa:.1f}°")
-    print(f"  • Maximum L/D ratio: {max_ld:.1f}")
-    print(f"  • Stall speed (sea level): {stall_speed_sl:.1f} m/s ({stall_speed_sl*3.6:.0f} km/h)")
-    print(f"  • Stall speed (10km alt): {stall_speed_10k:.1f} m/s ({stall_speed_10k*3.6:.0f} km/h)")
-    
+    print(f"  • Optimal angle of attack: {results.optimal_aoa:.1f}°")
+    print(f"  • Maximum L/D ratio: {results.max_ld:.1f}")
+    print(f"  • Stall speed (sea level): {results.stall_speed_sl:.1f} m/s ({results.stall_speed_sl*3.6:.0f} km/h)")
+    print(f"  • Stall speed (10km alt): {results.stall_speed_10k:.1f} m/s ({results.stall_speed_10k*3.6:.0f} km/h)")
+
     print(f"\nMission Performance:")
-    print(f"  • Estimated range: {range_km:.0f} km")
-    print(f"  • Estimated endurance: {endurance_hrs:.1f} hours")
-    print(f"  • Service ceiling: {service_ceiling:.0f} m ({service_ceiling/1000:.1f} km)")
-    print(f"  • Takeoff distance: {takeoff_data['total_distance']:.0f} m")
+    print(f"  • Estimated range: {results.range_km:.0f} km")
+    print(f"  • Estimated endurance: {results.endurance_hrs:.1f} hours")
+    print(f"  • Service ceiling: {results.service_ceiling:.0f} m ({results.service_ceiling/1000:.1f} km)")
+    print(f"  • Takeoff distance: {results.takeoff_data['total_distance']:.0f} m")
     
     # Design category assessment
     print(f"\nDesign Assessment:")
@@ -207,15 +248,50 @@ def show_aircraft_analysis(aircraft: Aircraft):
     else:
         print("  • Moderate sweep → Balanced speed capability")
     
-    if wing_loading > 4000:
+    if results.wing_loading > 4000:
         print("  • High wing loading → Fast cruise, longer runways")
-    elif wing_loading < 1500:
+    elif results.wing_loading < 1500:
         print("  • Low wing loading → Short runways, gentle handling")
     else:
         print("  • Moderate wing loading → Versatile performance")
 
 
-def create_comprehensive_analysis(aircraft: Aircraft):
+def _render_2d_figure(aircraft: Aircraft, aircraft_folder: str, plot_name: str,
+                      thrust_estimate: float = 50000):
+    """
+    Render one 2D performance figure in a worker process.
+
+    Module-level so it is picklable by ProcessPoolExecutor; each worker gets
+    its own matplotlib state, which pyplot cannot share across threads.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from src import AircraftVisualizer
+
+    plt.rcParams.update(_FAST_DRAW_RCPARAMS)
+
+    visualizer = AircraftVisualizer(aircraft)
+    visualizer.set_output_folder(aircraft_folder)
+
+    if plot_name == 'drag_polar':
+        fig = visualizer.plot_drag_polar('drag_polar.png')
+    elif plot_name == 'ld_vs_aoa':
+        fig = visualizer.plot_lift_drag_vs_aoa('ld_vs_aoa.png')
+    elif plot_name == 'vn_diagram':
+        fig = visualizer.plot_v_n_diagram(save_path='vn_diagram.png')
+    elif plot_name == 'performance_envelope':
+        fig = visualizer.plot_performance_envelope('performance_envelope.png')
+    elif plot_name == 'climb_performance':
+        fig = visualizer.plot_climb_performance(thrust_estimate, 'climb_performance.png')
+    else:
+        raise ValueError(f"Unknown plot: {plot_name}")
+
+    plt.close(fig)
+    return plot_name
+
+
+def create_comprehensive_analysis(aircraft: Aircraft, results: AnalysisResults):
     """Create comprehensive performance analysis and visualizations."""
     print(f"\n📊 Creating Comprehensive Performance Analysis...")
     
@@ -226,67 +302,56 @@ def create_comprehensive_analysis(aircraft: Aircraft):
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     folder_name = f"{safe_name}_{timestamp}"
     
-    visualizations_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'visualizations')
-    aircraft_folder = os.path.join(visualizations_dir, 'custom_designs', folder_name)
-    os.makedirs(aircraft_folder, exist_ok=True)
+    aircraft_path = VIS_ROOT / folder_name
+    aircraft_path.mkdir(parents=True, exist_ok=True)
+    aircraft_folder = str(aircraft_path)
     
     print(f"  📁 Created folder: visualizations/custom_designs/{folder_name}/")
     
-    # Import required modules
-    from src import (AircraftVisualizer, Aircraft3DVisualizer, PerformanceAnalyzer, 
-                    FlightEnvelope)
-    
-    # Create visualizers and set their output folders
-    visualizer_2d = AircraftVisualizer(aircraft)
-    visualizer_2d.set_output_folder(aircraft_folder)
-    
+    # Import required modules (deferred: plotting stacks are only loaded
+    # once a design actually reaches the analysis stage)
+    import matplotlib.pyplot as plt
+    from src import Aircraft3DVisualizer
+
+    plt.rcParams.update(_FAST_DRAW_RCPARAMS)
+
+    # 2D figures are rendered in worker processes below; only the 3D
+    # visualizer lives in this process
     visualizer_3d = Aircraft3DVisualizer(aircraft)
     visualizer_3d.set_output_folder(aircraft_folder)
-    
-    analyzer = PerformanceAnalyzer(aircraft)
-    envelope = FlightEnvelope(aircraft)
-    
+
     print("  📈 Generating performance plots...")
-    
-    # 1. Drag polar
-    fig1 = visualizer_2d.plot_drag_polar('drag_polar.png')
-    plt.close(fig1)
-    print("    ✓ Drag polar")
-    
-    # 2. L/D vs angle of attack
-    fig2 = visualizer_2d.plot_lift_drag_vs_aoa('ld_vs_aoa.png')
-    plt.close(fig2)
-    print("    ✓ L/D vs angle of attack")
-    
-    # 3. V-n diagram
-    fig3 = visualizer_2d.plot_v_n_diagram(save_path='vn_diagram.png')
-    plt.close(fig3)
-    print("    ✓ V-n diagram (flight envelope)")
-    
-    # 4. Performance envelope
-    fig4 = visualizer_2d.plot_performance_envelope('performance_envelope.png')
-    plt.close(fig4)
-    print("    ✓ Performance envelope (3D)")
-    
-    # 5. Climb performance (estimate thrust based on aircraft type)
-    # Estimate thrust based on aircraft characteristics
-    wing_loading = aircraft.mass.max_takeoff_weight * 9.81 / aircraft.geometry.wing_area
-    if wing_loading > 4000:  # High performance aircraft
+
+    # Estimate thrust for the climb plot based on aircraft characteristics
+    if results.wing_loading > 4000:  # High performance aircraft
         thrust_estimate = aircraft.mass.max_takeoff_weight * 9.81 * 0.8  # High T/W ratio
-    elif wing_loading < 1500:  # Light aircraft
+    elif results.wing_loading < 1500:  # Light aircraft
         thrust_estimate = aircraft.mass.max_takeoff_weight * 9.81 * 0.25  # Low T/W ratio
     else:  # Medium aircraft
         thrust_estimate = aircraft.mass.max_takeoff_weight * 9.81 * 0.4  # Medium T/W ratio
-    
-    fig5 = visualizer_2d.plot_climb_performance(thrust_estimate, 'climb_performance.png')
-    plt.close(fig5)
-    print("    ✓ Climb performance")
-    
+
+    # 1-5. The 2D plots are independent, so render them in worker processes
+    # and let PNG encoding overlap instead of running back to back
+    plot_labels = {
+        'drag_polar': 'Drag polar',
+        'ld_vs_aoa': 'L/D vs angle of attack',
+        'vn_diagram': 'V-n diagram (flight envelope)',
+        'performance_envelope': 'Performance envelope (3D)',
+        'climb_performance': 'Climb performance'
+    }
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(_render_2d_figure, aircraft, aircraft_folder,
+                               name, thrust_estimate) for name in plot_labels]
+        for future in as_completed(futures):
+            print(f"    ✓ {plot_labels[future.result()]}")
+
     print("  🛩️ Generating 3D visualization...")
     
     # 6. 3D aircraft model
     fig6 = visualizer_3d.plot_3d_aircraft_matplotlib('aircraft_3d.png')
-    plt.show()  # Display the 3D plot
+    if INTERACTIVE and plt.get_backend().lower() != 'agg':
+        plt.show()
     plt.close(fig6)
     print("    ✓ 3D aircraft model")
     
@@ -294,11 +359,14 @@ def create_comprehensive_analysis(aircraft: Aircraft):
     interactive_fig = visualizer_3d.create_interactive_3d_plotly()
     interactive_filename = 'aircraft_interactive.html'
     interactive_path = os.path.join(aircraft_folder, interactive_filename)
-    interactive_fig.write_html(interactive_path)
+    # Load plotly.js from the CDN instead of embedding the ~3 MB bundle in
+    # every design's HTML file
+    interactive_fig.write_html(interactive_path, include_plotlyjs='cdn',
+                               full_html=True, auto_open=False)
     print("    ✓ Interactive 3D model")
     
     # 8. Create summary dashboard
-    create_performance_summary_plot(aircraft, aircraft_folder)
+    create_performance_summary_plot(aircraft, aircraft_folder, results)
     print("    ✓ Performance summary dashboard")
     
     print(f"\n  📁 Generated Files in '{folder_name}/':")
@@ -312,49 +380,48 @@ def create_comprehensive_analysis(aircraft: Aircraft):
     print(f"    • performance_summary.png")
     
     # Create a README file for the aircraft folder
-    create_aircraft_readme(aircraft, aircraft_folder, folder_name)
+    create_aircraft_readme(aircraft, aircraft_folder, folder_name, results)
     print(f"    • README.md (aircraft specifications)")
     
-    # Try to open interactive version
-    try:
-        import webbrowser
-        print(f"\n  🌐 Opening interactive 3D model in browser...")
-        webbrowser.open(interactive_path)
-    except:
+    # Only launch a browser for a human at a machine with a display;
+    # batch/headless runs skip the subprocess entirely
+    if INTERACTIVE and (os.environ.get('DISPLAY') or sys.platform in ('darwin', 'win32')):
+        try:
+            import webbrowser
+            print(f"\n  🌐 Opening interactive 3D model in browser...")
+            webbrowser.open(interactive_path)
+        except:
+            print(f"\n  💡 Open '{interactive_filename}' in your browser for interactivity")
+    else:
         print(f"\n  💡 Open '{interactive_filename}' in your browser for interactivity")
     
     return aircraft_folder
 
 
-def create_performance_summary_plot(aircraft: Aircraft, aircraft_folder: str):
+def create_performance_summary_plot(aircraft: Aircraft, aircraft_folder: str, results: AnalysisResults):
     """Create a comprehensive performance summary dashboard."""
-    from src import PerformanceAnalyzer, FlightEnvelope
-    
-    analyzer = PerformanceAnalyzer(aircraft)
+    import numpy as np
+    import matplotlib.pyplot as plt
+    from src import FlightEnvelope
+
     envelope = FlightEnvelope(aircraft)
-    
+
     # Create figure with multiple subplots
     fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
     
     # 1. Drag polar (top left)
+    # One call evaluates all three coefficient curves for the whole sweep
     angles = np.linspace(-5, 20, 100)
-    cl_values = []
-    cd_values = []
-    
-    for angle in angles:
-        cl = aircraft.calculate_lift_coefficient(angle)
-        cd = aircraft.calculate_drag_coefficient(cl)
-        cl_values.append(cl)
-        cd_values.append(cd)
-    
-    ax1.plot(cd_values, cl_values, 'b-', linewidth=2)
+    cl_values, cd_values, ld_ratios = aircraft.calculate_aero_sweep(angles)
+
+    ax1.plot(cd_values, cl_values, 'b-', linewidth=2, rasterized=True)
     ax1.grid(True, alpha=0.3)
     ax1.set_xlabel('Drag Coefficient (CD)')
     ax1.set_ylabel('Lift Coefficient (CL)')
     ax1.set_title('Drag Polar')
     
     # Mark optimal point
-    optimal_aoa = analyzer.find_optimal_angle_of_attack()
+    optimal_aoa = results.optimal_aoa
     optimal_cl = aircraft.calculate_lift_coefficient(optimal_aoa)
     optimal_cd = aircraft.calculate_drag_coefficient(optimal_cl)
     ax1.plot(optimal_cd, optimal_cl, 'ro', markersize=8)
@@ -363,33 +430,26 @@ def create_performance_summary_plot(aircraft: Aircraft, aircraft_folder: str):
                 arrowprops=dict(arrowstyle='->', color='red'))
     
     # 2. L/D vs AoA (top right)
-    ld_ratios = []
-    for angle in angles:
-        ld = aircraft.calculate_lift_drag_ratio(angle)
-        ld_ratios.append(ld)
-    
-    ax2.plot(angles, ld_ratios, 'g-', linewidth=2)
+    ax2.plot(angles, ld_ratios, 'g-', linewidth=2, rasterized=True)
     ax2.grid(True, alpha=0.3)
     ax2.set_xlabel('Angle of Attack (degrees)')
     ax2.set_ylabel('L/D Ratio')
     ax2.set_title('Lift-to-Drag Ratio vs AoA')
     
     # Mark optimal point
-    max_ld = aircraft.calculate_lift_drag_ratio(optimal_aoa)
+    max_ld = results.max_ld
     ax2.plot(optimal_aoa, max_ld, 'ro', markersize=8)
     ax2.annotate(f'Max L/D\n({optimal_aoa:.1f}°, {max_ld:.1f})', 
                 xy=(optimal_aoa, max_ld), xytext=(optimal_aoa+2, max_ld+1),
                 arrowprops=dict(arrowstyle='->', color='red'))
     
     # 3. Stall speed vs altitude (bottom left)
+    # calculate_stall_speed accepts the whole altitude vector, computing the
+    # ISA densities and the sqrt in one pass
     altitudes = np.linspace(0, 15000, 30)
-    stall_speeds = []
-    
-    for alt in altitudes:
-        v_stall = envelope.calculate_stall_speed(alt, aircraft.mass.max_takeoff_weight)
-        stall_speeds.append(v_stall)
-    
-    ax3.plot(stall_speeds, altitudes, 'r-', linewidth=2)
+    stall_speeds = envelope.calculate_stall_speed(altitudes, aircraft.mass.max_takeoff_weight)
+
+    ax3.plot(stall_speeds, altitudes, 'r-', linewidth=2, rasterized=True)
     ax3.grid(True, alpha=0.3)
     ax3.set_xlabel('Stall Speed (m/s)')
     ax3.set_ylabel('Altitude (m)')
@@ -398,10 +458,10 @@ def create_performance_summary_plot(aircraft: Aircraft, aircraft_folder: str):
     # 4. Performance summary bars (bottom right)
     metrics = ['Wing Loading\n(N/m²)', 'Max L/D', 'Aspect Ratio', 'Fuel Fraction\n(%)', 'T/O Distance\n(m)']
     
-    wing_loading = aircraft.mass.max_takeoff_weight * 9.81 / aircraft.geometry.wing_area
-    fuel_fraction = aircraft.mass.fuel_capacity / aircraft.mass.max_takeoff_weight * 100
-    takeoff_data = analyzer.analyze_takeoff_performance(3000)
-    
+    wing_loading = results.wing_loading
+    fuel_fraction = results.fuel_fraction * 100
+    takeoff_data = results.takeoff_data
+
     values = [wing_loading/100, max_ld, aircraft.geometry.aspect_ratio, fuel_fraction, takeoff_data['total_distance']/100]
     colors = ['skyblue', 'lightgreen', 'orange', 'pink', 'lightcoral']
     
@@ -410,46 +470,42 @@ def create_performance_summary_plot(aircraft: Aircraft, aircraft_folder: str):
     ax4.set_ylabel('Normalized Values')
     ax4.tick_params(axis='x', rotation=45)
     
-    # Add value labels on bars
-    for bar, value, original in zip(bars, values, [wing_loading, max_ld, aircraft.geometry.aspect_ratio, fuel_fraction, takeoff_data['total_distance']]):
-        height = bar.get_height()
-        ax4.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                f'{original:.1f}', ha='center', va='bottom', fontsize=9)
+    # Add value labels on bars in one batched call
+    originals = [wing_loading, max_ld, aircraft.geometry.aspect_ratio, fuel_fraction, takeoff_data['total_distance']]
+    ax4.bar_label(bars, labels=[f'{original:.1f}' for original in originals], padding=3, fontsize=9)
     
     # Overall title
     plt.suptitle(f'Performance Analysis Summary - {aircraft.name}', fontsize=16, fontweight='bold')
     plt.tight_layout()
     
-    # Save summary
+    # Save summary; 150 dpi is plenty for a 16x12 dashboard and cuts the
+    # Agg rasterization work (and file size) by ~4x vs 300 dpi.
+    # tight_layout above already sizes the margins, so bbox_inches='tight'
+    # (which would trigger a second full render pass) is omitted
     summary_path = os.path.join(aircraft_folder, 'performance_summary.png')
-    plt.savefig(summary_path, dpi=300, bbox_inches='tight')
+    plt.savefig(summary_path, dpi=150)
     plt.close()
 
 
-def create_aircraft_readme(aircraft: Aircraft, aircraft_folder: str, folder_name: str):
+def create_aircraft_readme(aircraft: Aircraft, aircraft_folder: str, folder_name: str,
+                           results: AnalysisResults):
     """Create a README file with aircraft specifications and analysis results."""
-    from src import PerformanceAnalyzer, FlightEnvelope
-    
-    analyzer = PerformanceAnalyzer(aircraft)
-    envelope = FlightEnvelope(aircraft)
-    
-    # Calculate performance metrics
-    optimal_aoa = analyzer.find_optimal_angle_of_attack()
-    max_ld = aircraft.calculate_lift_drag_ratio(optimal_aoa)
-    stall_speed_sl = envelope.calculate_stall_speed(0, aircraft.mass.max_takeoff_weight)
-    stall_speed_10k = envelope.calculate_stall_speed(10000, aircraft.mass.max_takeoff_weight)
-    service_ceiling = envelope.calculate_service_ceiling(aircraft.mass.max_takeoff_weight)
-    range_km = analyzer.calculate_range(10000, 200, aircraft.mass.fuel_capacity)
-    endurance_hrs = analyzer.calculate_endurance(8000, aircraft.mass.fuel_capacity)
-    takeoff_data = analyzer.analyze_takeoff_performance(3000)
-    
-    # Wing loading and other derived parameters
-    wing_loading = aircraft.mass.max_takeoff_weight * 9.81 / aircraft.geometry.wing_area
-    fuel_fraction = aircraft.mass.fuel_capacity / aircraft.mass.max_takeoff_weight
-    payload_fraction = aircraft.mass.payload_capacity / aircraft.mass.max_takeoff_weight
-    
-    # Create README content
-    readme_content = f"""# {aircraft.name}
+    # All performance metrics were computed once up front
+    optimal_aoa = results.optimal_aoa
+    max_ld = results.max_ld
+    stall_speed_sl = results.stall_speed_sl
+    stall_speed_10k = results.stall_speed_10k
+    service_ceiling = results.service_ceiling
+    range_km = results.range_km
+    endurance_hrs = results.endurance_hrs
+    takeoff_data = results.takeoff_data
+    wing_loading = results.wing_loading
+    fuel_fraction = results.fuel_fraction
+    payload_fraction = results.payload_fraction
+
+    # Accumulate README sections in a list and join once at the end,
+    # avoiding repeated string reallocation
+    parts = [f"""# {aircraft.name}
 
 **Custom Aircraft Design Analysis**  
 Generated: {folder_name.split('_')[-2]}_{folder_name.split('_')[-1]}
@@ -496,31 +552,31 @@ Generated: {folder_name.split('_')[-2]}_{folder_name.split('_')[-1]}
 ## Design Assessment
 
 ### Strengths
-"""
-    
+"""]
+
     # Add design assessment
     if aircraft.geometry.aspect_ratio > 8:
-        readme_content += "- High aspect ratio provides excellent fuel efficiency\n"
+        parts.append("- High aspect ratio provides excellent fuel efficiency\n")
     elif aircraft.geometry.aspect_ratio < 5:
-        readme_content += "- Low aspect ratio enables high maneuverability\n"
+        parts.append("- Low aspect ratio enables high maneuverability\n")
     else:
-        readme_content += "- Moderate aspect ratio balances efficiency and maneuverability\n"
-    
+        parts.append("- Moderate aspect ratio balances efficiency and maneuverability\n")
+
     if aircraft.geometry.sweep_angle > 20:
-        readme_content += "- Swept wing design suitable for high-speed flight\n"
+        parts.append("- Swept wing design suitable for high-speed flight\n")
     elif aircraft.geometry.sweep_angle < 5:
-        readme_content += "- Straight wing provides excellent low-speed handling\n"
+        parts.append("- Straight wing provides excellent low-speed handling\n")
     else:
-        readme_content += "- Moderate sweep balances speed and handling characteristics\n"
-    
+        parts.append("- Moderate sweep balances speed and handling characteristics\n")
+
     if wing_loading > 4000:
-        readme_content += "- High wing loading enables fast cruise speeds\n"
+        parts.append("- High wing loading enables fast cruise speeds\n")
     elif wing_loading < 1500:
-        readme_content += "- Low wing loading allows short runway operations\n"
+        parts.append("- Low wing loading allows short runway operations\n")
     else:
-        readme_content += "- Moderate wing loading provides versatile performance\n"
-    
-    readme_content += f"""
+        parts.append("- Moderate wing loading provides versatile performance\n")
+
+    parts.append(f"""
 ### Trade-offs
 - Range vs Payload: Current fuel fraction of {fuel_fraction:.1%} prioritizes {'range' if fuel_fraction > 0.3 else 'payload'}
 - Speed vs Efficiency: Design optimized for {'speed' if aircraft.geometry.sweep_angle > 15 else 'efficiency'}
@@ -550,12 +606,12 @@ Generated: {folder_name.split('_')[-2]}_{folder_name.split('_')[-1]}
 
 ---
 *Generated by Aircraft Design System v1.0*
-"""
-    
+""")
+
     # Write README file
     readme_path = os.path.join(aircraft_folder, 'README.md')
     with open(readme_path, 'w') as f:
-        f.write(readme_content)
+        f.write("".join(parts))
 
 
 def compare_with_reference_aircraft(custom_aircraft: Aircraft):
@@ -563,14 +619,16 @@ def compare_with_reference_aircraft(custom_aircraft: Aircraft):
     print(f"\n🔄 COMPARISON WITH REFERENCE AIRCRAFT")
     print("=" * 50)
     
+    import matplotlib.pyplot as plt
     from src import create_sample_aircraft, create_aircraft_comparison_3d
     
     reference_aircraft = create_sample_aircraft()
-    all_aircraft = reference_aircraft + [custom_aircraft]
+    all_aircraft = [*reference_aircraft, custom_aircraft]
     
     print("Creating comparison visualization...")
     fig = create_aircraft_comparison_3d(all_aircraft, f"custom_aircraft_comparison.png")
-    plt.show()  # Display the comparison
+    if INTERACTIVE and plt.get_backend().lower() != 'agg':
+        plt.show()
     plt.close(fig)
     
     print("  ✓ Comparison saved as 'custom_aircraft_comparison.png'")
@@ -580,22 +638,18 @@ def compare_with_reference_aircraft(custom_aircraft: Aircraft):
     print(f"{'Parameter':<20} {'Airliner':<12} {'GA':<12} {'Fighter':<12} {'Your Design':<12}")
     print("-" * 68)
     
+    # Each attribute's container is known up front, so look it up directly
+    # instead of probing with hasattr per table cell
     params = [
-        ('Wing Span (m)', 'wing_span'),
-        ('Aspect Ratio', 'aspect_ratio'),
-        ('Sweep Angle (°)', 'sweep_angle'),
-        ('MTOW (kg)', 'max_takeoff_weight')
+        ('Wing Span (m)', 'geometry', 'wing_span'),
+        ('Aspect Ratio', 'geometry', 'aspect_ratio'),
+        ('Sweep Angle (°)', 'geometry', 'sweep_angle'),
+        ('MTOW (kg)', 'mass', 'max_takeoff_weight')
     ]
-    
-    for param_name, attr in params:
-        values = []
-        for aircraft in all_aircraft:
-            if hasattr(aircraft.geometry, attr):
-                value = getattr(aircraft.geometry, attr)
-            else:
-                value = getattr(aircraft.mass, attr)
-            values.append(f"{value:.1f}")
-        
+
+    for param_name, container, attr in params:
+        values = [f"{getattr(getattr(aircraft, container), attr):.1f}"
+                  for aircraft in all_aircraft]
         print(f"{param_name:<20} {values[0]:<12} {values[1]:<12} {values[2]:<12} {values[3]:<12}")
 
 
@@ -609,12 +663,15 @@ def main():
     try:
         # Design aircraft interactively
         custom_aircraft = design_aircraft_interactively()
-        
+
+        # Run the performance analysis once; every report reuses the results
+        results = analyze_aircraft(custom_aircraft)
+
         # Show analysis
-        show_aircraft_analysis(custom_aircraft)
-        
+        show_aircraft_analysis(custom_aircraft, results)
+
         # Create comprehensive performance analysis
-        create_comprehensive_analysis(custom_aircraft)
+        create_comprehensive_analysis(custom_aircraft, results)
         
         # Ask if user wants comparison
         print(f"\n" + "=" * 50)
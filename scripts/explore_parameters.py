@@ -10,6 +10,8 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+import numpy as np
+
 from src import create_sample_aircraft, AircraftGeometry, AircraftMass
 
 
@@ -61,46 +63,45 @@ def explore_aircraft_parameters():
         ('Empty Weight', 'empty_weight', 'kg'),
         ('Fuel Capacity', 'fuel_capacity', 'kg')
     ]
-    
+
+    # Each attribute lives on exactly one container; resolving that once
+    # here avoids per-cell hasattr probing and makes a typo fail loudly
+    # instead of silently printing 0
+    container = {
+        'wing_span': 'geometry',
+        'wing_area': 'geometry',
+        'aspect_ratio': 'geometry',
+        'sweep_angle': 'geometry',
+        'thickness_ratio': 'geometry',
+        'max_takeoff_weight': 'mass',
+        'empty_weight': 'mass',
+        'fuel_capacity': 'mass'
+    }
+
     for param_name, attr_name, unit in params:
         values = []
         for aircraft in aircraft_list:
-            if hasattr(aircraft.geometry, attr_name):
-                value = getattr(aircraft.geometry, attr_name)
-            elif hasattr(aircraft.mass, attr_name):
-                value = getattr(aircraft.mass, attr_name)
-            else:
-                value = 0
+            value = getattr(getattr(aircraft, container[attr_name]), attr_name)
             values.append(f"{value:.1f}" if isinstance(value, float) else str(value))
-        
+
         print(f"{param_name:<20} {values[0]:<12} {values[1]:<12} {values[2]:<12} {unit:<8}")
     
     # Calculate and show derived parameters
     print(f"\n{'Derived Parameters':<20} {'Airliner':<12} {'GA Aircraft':<12} {'Fighter':<12} {'Units':<8}")
     print("-" * 70)
     
-    for aircraft in aircraft_list:
-        wing_loading = aircraft.mass.max_takeoff_weight * 9.81 / aircraft.geometry.wing_area
-        fuel_fraction = aircraft.mass.fuel_capacity / aircraft.mass.max_takeoff_weight
-        payload_fraction = aircraft.mass.payload_capacity / aircraft.mass.max_takeoff_weight
-        
-        if aircraft == aircraft_list[0]:  # First iteration, print labels
-            print(f"{'Wing Loading':<20} {wing_loading:<12.0f}", end="")
-        elif aircraft == aircraft_list[1]:
-            wing_loading_ga = aircraft.mass.max_takeoff_weight * 9.81 / aircraft.geometry.wing_area
-            print(f" {wing_loading_ga:<12.0f}", end="")
-        else:
-            wing_loading_fighter = aircraft.mass.max_takeoff_weight * 9.81 / aircraft.geometry.wing_area
-            print(f" {wing_loading_fighter:<12.0f} {'N/m²':<8}")
-            
-        if aircraft == aircraft_list[0]:
-            print(f"{'Fuel Fraction':<20} {fuel_fraction:<12.3f}", end="")
-        elif aircraft == aircraft_list[1]:
-            fuel_fraction_ga = aircraft.mass.fuel_capacity / aircraft.mass.max_takeoff_weight
-            print(f" {fuel_fraction_ga:<12.3f}", end="")
-        else:
-            fuel_fraction_fighter = aircraft.mass.fuel_capacity / aircraft.mass.max_takeoff_weight
-            print(f" {fuel_fraction_fighter:<12.3f} {'-':<8}")
+    # Vectorized over the fleet: gather the raw properties into arrays,
+    # derive both rows with ndarray math, and print each row in one go
+    mtow = np.array([aircraft.mass.max_takeoff_weight for aircraft in aircraft_list])
+    wing_area = np.array([aircraft.geometry.wing_area for aircraft in aircraft_list])
+    fuel = np.array([aircraft.mass.fuel_capacity for aircraft in aircraft_list])
+
+    wing_loadings = mtow * 9.81 / wing_area
+    fuel_fractions = fuel / mtow
+
+    wl, ff = wing_loadings, fuel_fractions
+    print(f"{'Wing Loading':<20} {wl[0]:<12.0f} {wl[1]:<12.0f} {wl[2]:<12.0f} {'N/m²':<8}")
+    print(f"{'Fuel Fraction':<20} {ff[0]:<12.3f} {ff[1]:<12.3f} {ff[2]:<12.3f} {'-':<8}")
     
     # Show design insights
     print(f"\n🎯 DESIGN INSIGHTS:")
@@ -8,6 +8,7 @@ using Plotly for dynamic exploration of aircraft performance.
 
 import sys
 import os
+from pathlib import Path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 import plotly.graph_objects as go
@@ -19,12 +20,53 @@ from src import (
     create_interactive_dashboard
 )
 
+# Shared angle-of-attack grid for all sweep traces, allocated once
+_ANGLES_DEG = np.linspace(-5.0, 20.0, 100)
 
-def create_interactive_comparison():
+# Output root, resolved once at import instead of per function
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+VIS_DIR = PROJECT_ROOT / 'visualizations'
+
+
+def _downsample_lttb(x, y, n_out=800):
+    """
+    Largest-Triangle-Three-Buckets downsampling for line traces.
+
+    Caps the points embedded in the exported HTML while keeping the visual
+    shape of the curve. Series already within the budget pass through
+    untouched, so the small default sweeps are unaffected.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = x.size
+    if n <= n_out:
+        return x, y
+
+    idx = np.empty(n_out, dtype=np.intp)
+    idx[0] = 0
+    idx[-1] = n - 1
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+
+    prev = 0
+    for i in range(n_out - 2):
+        lo = edges[i]
+        hi = max(edges[i + 1], lo + 1)
+        nxt_hi = edges[i + 2] if i + 2 <= n_out - 2 else n - 1
+        avg_x = x[hi:nxt_hi + 1].mean()
+        avg_y = y[hi:nxt_hi + 1].mean()
+        # Pick the bucket point forming the largest triangle with the
+        # previously kept point and the next bucket's centroid
+        areas = np.abs((x[prev] - avg_x) * (y[lo:hi] - y[prev]) -
+                       (x[prev] - x[lo:hi]) * (avg_y - y[prev]))
+        prev = lo + int(np.argmax(areas))
+        idx[i + 1] = prev
+
+    return x[idx], y[idx]
+
+
+def create_interactive_comparison(aircraft_list):
     """Create an interactive comparison of all three aircraft types"""
-    
-    aircraft_list = create_sample_aircraft()
-    
+
     # Create subplots
     fig = make_subplots(
         rows=2, cols=2,
@@ -35,48 +77,31 @@ def create_interactive_comparison():
     )
     
     colors = ['blue', 'red', 'green']
-    
-    # Drag polar comparison
+    angles = _ANGLES_DEG
+
+    # Drag polar and L/D comparison: one fused pass per aircraft computes
+    # all three coefficient curves and emits both traces
     for i, aircraft in enumerate(aircraft_list):
-        angles = np.linspace(-5, 20, 100)
-        cl_values = []
-        cd_values = []
-        
-        for angle in angles:
-            cl = aircraft.calculate_lift_coefficient(angle)
-            cd = aircraft.calculate_drag_coefficient(cl)
-            cl_values.append(cl)
-            cd_values.append(cd)
-        
+        cl_values, cd_values, ld_ratios = aircraft.calculate_aero_sweep(angles)
+
         fig.add_trace(
-            go.Scatter(x=cd_values, y=cl_values, mode='lines', 
-                      name=f'{aircraft.name} - Drag Polar',
-                      line=dict(color=colors[i], width=3)),
+            go.Scattergl(x=cd_values, y=cl_values, mode='lines',
+                        name=f'{aircraft.name} - Drag Polar',
+                        line=dict(color=colors[i], width=3)),
             row=1, col=1
         )
-    
-    # L/D ratio comparison
-    for i, aircraft in enumerate(aircraft_list):
-        angles = np.linspace(-5, 20, 100)
-        ld_ratios = []
-        
-        for angle in angles:
-            ld = aircraft.calculate_lift_drag_ratio(angle)
-            ld_ratios.append(ld)
-        
         fig.add_trace(
-            go.Scatter(x=angles, y=ld_ratios, mode='lines',
-                      name=f'{aircraft.name} - L/D',
-                      line=dict(color=colors[i], width=3)),
+            go.Scattergl(x=angles, y=ld_ratios, mode='lines',
+                        name=f'{aircraft.name} - L/D',
+                        line=dict(color=colors[i], width=3)),
             row=1, col=2
         )
     
     # Performance summary bar chart
     aircraft_names = [aircraft.name for aircraft in aircraft_list]
-    wing_loadings = [aircraft.mass.max_takeoff_weight * 9.81 / aircraft.geometry.wing_area 
-                    for aircraft in aircraft_list]
-    aspect_ratios = [aircraft.geometry.aspect_ratio for aircraft in aircraft_list]
-    
+    wing_loadings = np.fromiter((aircraft.wing_loading for aircraft in aircraft_list),
+                                dtype=np.float64, count=len(aircraft_list))
+
     fig.add_trace(
         go.Bar(x=aircraft_names, y=wing_loadings, name='Wing Loading (N/m²)',
                marker_color=colors),
@@ -86,54 +111,52 @@ def create_interactive_comparison():
     # V-n diagram comparison
     for i, aircraft in enumerate(aircraft_list):
         envelope = FlightEnvelope(aircraft)
-        velocities, load_factors = envelope.generate_v_n_diagram()
-        
+        velocities, load_factors = _downsample_lttb(*envelope.generate_v_n_diagram())
+
         fig.add_trace(
-            go.Scatter(x=velocities, y=load_factors, mode='lines',
-                      name=f'{aircraft.name} - Flight Envelope',
-                      line=dict(color=colors[i], width=3),
-                      fill='tonexty' if i == 0 else None),
+            go.Scattergl(x=velocities, y=load_factors, mode='lines',
+                        name=f'{aircraft.name} - Flight Envelope',
+                        line=dict(color=colors[i], width=3),
+                        fill='tonexty' if i == 0 else None),
             row=2, col=2
         )
     
-    # Update layout
+    # Update layout and axis labels in a single merge; subplot axes are
+    # numbered xaxis..xaxis4 row-major by make_subplots
     fig.update_layout(
         title='Interactive Aircraft Design Comparison Dashboard',
         height=800,
-        showlegend=True
+        showlegend=True,
+        xaxis=dict(title_text="Drag Coefficient (CD)"),
+        yaxis=dict(title_text="Lift Coefficient (CL)"),
+        xaxis2=dict(title_text="Angle of Attack (degrees)"),
+        yaxis2=dict(title_text="L/D Ratio"),
+        xaxis3=dict(title_text="Aircraft Type"),
+        yaxis3=dict(title_text="Wing Loading (N/m²)"),
+        xaxis4=dict(title_text="Velocity (m/s)"),
+        yaxis4=dict(title_text="Load Factor (g)")
     )
-    
-    # Update axis labels
-    fig.update_xaxes(title_text="Drag Coefficient (CD)", row=1, col=1)
-    fig.update_yaxes(title_text="Lift Coefficient (CL)", row=1, col=1)
-    
-    fig.update_xaxes(title_text="Angle of Attack (degrees)", row=1, col=2)
-    fig.update_yaxes(title_text="L/D Ratio", row=1, col=2)
-    
-    fig.update_xaxes(title_text="Aircraft Type", row=2, col=1)
-    fig.update_yaxes(title_text="Wing Loading (N/m²)", row=2, col=1)
-    
-    fig.update_xaxes(title_text="Velocity (m/s)", row=2, col=2)
-    fig.update_yaxes(title_text="Load Factor (g)", row=2, col=2)
-    
+
     return fig
 
 
-def create_3d_performance_surface():
+def create_3d_performance_surface(airliner):
     """Create a 3D surface plot of aircraft performance"""
-    
-    # Use the commercial airliner for this demo
-    aircraft_list = create_sample_aircraft()
-    airliner = aircraft_list[0]
-    
+
     analyzer = PerformanceAnalyzer(airliner)
     performance_data = analyzer.generate_performance_envelope()
-    
+
+    # The L/D surface is smooth, so a 2x-strided float32 grid looks the
+    # same while serializing to a fraction of the JSON bytes
+    z = performance_data['ld_ratios'].astype(np.float32)[::2, ::2]
+    x = performance_data['speeds'][::2]
+    y = performance_data['altitudes'][::2]
+
     # Create 3D surface plot
     fig = go.Figure(data=[go.Surface(
-        z=performance_data['ld_ratios'],
-        x=performance_data['speeds'],
-        y=performance_data['altitudes'],
+        z=z,
+        x=x,
+        y=y,
         colorscale='Viridis',
         name='L/D Ratio'
     )])
@@ -152,69 +175,162 @@ def create_3d_performance_surface():
     return fig
 
 
+def _write_html(fig, path):
+    """
+    Serialize a figure to one bytes blob and write it in a single call.
+
+    Avoids the many small writes fig.write_html performs on multi-MB
+    files; a path ending in '.html.gz' gets gzip-compressed in memory
+    for local static hosting.
+    """
+    html = fig.to_html(include_plotlyjs='cdn', include_mathjax=False,
+                       full_html=True, config={'responsive': True}).encode('utf-8')
+    if path.endswith('.html.gz'):
+        import gzip
+        html = gzip.compress(html)
+    with open(path, 'wb') as f:
+        f.write(html)
+
+
+def _fleet_key(aircraft_list):
+    """Cheap content hash of the fleet's parameters, for skip-if-unchanged."""
+    import dataclasses
+    import hashlib
+    payload = repr([(a.name, dataclasses.astuple(a.geometry), dataclasses.astuple(a.mass),
+                     a.cd0, a.k, a.cl_max, a.cl_alpha) for a in aircraft_list])
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _is_current(path, key):
+    """True when the HTML at path was generated from the same fleet key."""
+    keyfile = path + '.key'
+    try:
+        with open(keyfile) as f:
+            return os.path.exists(path) and f.read().strip() == key
+    except OSError:
+        return False
+
+
+def _mark_current(path, key):
+    """Record the fleet key the HTML at path was generated from."""
+    with open(path + '.key', 'w') as f:
+        f.write(key)
+
+
+def _render_dashboard(args):
+    """
+    Render one aircraft's dashboard HTML in a worker process.
+
+    Module-level so ProcessPoolExecutor can pickle it; the three reference
+    dashboards are independent files and render concurrently.
+    """
+    aircraft, folder_name, reference_dir, flat = args
+    if flat:
+        # Flat layout: one file per aircraft directly in the output dir
+        dashboard_path = os.path.join(reference_dir, f"{folder_name}_dashboard_interactive.html")
+    else:
+        aircraft_folder = os.path.join(reference_dir, folder_name)
+        os.makedirs(aircraft_folder, exist_ok=True)
+        dashboard_path = os.path.join(aircraft_folder, "dashboard_interactive.html")
+
+    dashboard_fig = create_interactive_dashboard(aircraft)
+    _write_html(dashboard_fig, dashboard_path)
+    return folder_name
+
+
 def main():
     """Run the interactive demo"""
-    
+
+    import argparse
+    parser = argparse.ArgumentParser(description='Generate interactive aircraft visualizations')
+    parser.add_argument('--flat', action='store_true',
+                        help='write all HTML files directly into visualizations/ '
+                             'instead of the organized subfolder layout')
+    args = parser.parse_args()
+
     print("🛩️  Aircraft Design Interactive Demo")
     print("=" * 50)
     print("Generating interactive visualizations...")
-    
-    # Create organized folder structure
-    visualizations_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'visualizations')
-    comparisons_dir = os.path.join(visualizations_dir, 'comparisons')
-    examples_dir = os.path.join(visualizations_dir, 'examples')
-    reference_dir = os.path.join(visualizations_dir, 'reference_aircraft')
-    
+
+    # Select the output layout once; everything below just uses these paths
+    if args.flat:
+        comparisons_dir = examples_dir = reference_dir = str(VIS_DIR)
+    else:
+        comparisons_dir = str(VIS_DIR / 'comparisons')
+        examples_dir = str(VIS_DIR / 'examples')
+        reference_dir = str(VIS_DIR / 'reference_aircraft')
+
     os.makedirs(comparisons_dir, exist_ok=True)
     os.makedirs(examples_dir, exist_ok=True)
-    
+
+    # Build the sample fleet once; every figure below reuses the same objects
+    aircraft_list = create_sample_aircraft()
+    # Hash of the fleet parameters: figures whose inputs are unchanged
+    # since the last run are skipped entirely
+    fleet_key = _fleet_key(aircraft_list)
+
     # Create comparison dashboard
     print("1. Creating aircraft comparison dashboard...")
-    comparison_fig = create_interactive_comparison()
     comparison_path = os.path.join(comparisons_dir, "aircraft_comparison_interactive.html")
-    comparison_fig.write_html(comparison_path)
-    print("   ✓ Saved in 'comparisons/'")
-    
+    if _is_current(comparison_path, fleet_key):
+        print("   ✓ Up to date in 'comparisons/' (skipped)")
+    else:
+        comparison_fig = create_interactive_comparison(aircraft_list)
+        _write_html(comparison_fig, comparison_path)
+        _mark_current(comparison_path, fleet_key)
+        print("   ✓ Saved in 'comparisons/'")
+
     # Create 3D performance surface
     print("2. Creating 3D performance surface...")
-    surface_fig = create_3d_performance_surface()
     surface_path = os.path.join(examples_dir, "performance_3d_interactive.html")
-    surface_fig.write_html(surface_path)
-    print("   ✓ Saved in 'examples/'")
-    
-    # Create individual aircraft dashboards
-    aircraft_list = create_sample_aircraft()
+    if _is_current(surface_path, fleet_key):
+        print("   ✓ Up to date in 'examples/' (skipped)")
+    else:
+        surface_fig = create_3d_performance_surface(aircraft_list[0])
+        _write_html(surface_fig, surface_path)
+        _mark_current(surface_path, fleet_key)
+        print("   ✓ Saved in 'examples/'")
+
+    # Create individual aircraft dashboards concurrently — each is an
+    # independent figure build plus HTML write
     aircraft_folder_names = ['commercial_airliner', 'general_aviation', 'fighter_jet']
-    
-    for aircraft, folder_name in zip(aircraft_list, aircraft_folder_names):
-        print(f"3. Creating dashboard for {aircraft.name}...")
-        
-        # Create aircraft-specific folder
-        aircraft_folder = os.path.join(reference_dir, folder_name)
-        os.makedirs(aircraft_folder, exist_ok=True)
-        
-        dashboard_fig = create_interactive_dashboard(aircraft)
-        dashboard_path = os.path.join(aircraft_folder, "dashboard_interactive.html")
-        dashboard_fig.write_html(dashboard_path)
-        print(f"   ✓ Saved in 'reference_aircraft/{folder_name}/'")
+
+    print("3. Creating per-aircraft dashboards...")
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=3) as pool:
+        jobs = zip(aircraft_list, aircraft_folder_names,
+                   [reference_dir] * 3, [args.flat] * 3)
+        for folder_name in pool.map(_render_dashboard, jobs):
+            print(f"   ✓ Saved dashboard for '{folder_name}'")
     
     print("\n" + "=" * 50)
     print("✅ Interactive visualizations created!")
-    print("\nGenerated files in organized folders:")
-    print("- comparisons/aircraft_comparison_interactive.html")
-    print("- examples/performance_3d_interactive.html")
-    print("- reference_aircraft/commercial_airliner/dashboard_interactive.html")
-    print("- reference_aircraft/general_aviation/dashboard_interactive.html")
-    print("- reference_aircraft/fighter_jet/dashboard_interactive.html")
+    if args.flat:
+        print("\nGenerated files directly in 'visualizations/':")
+        print("- aircraft_comparison_interactive.html")
+        print("- performance_3d_interactive.html")
+        for folder_name in aircraft_folder_names:
+            print(f"- {folder_name}_dashboard_interactive.html")
+    else:
+        print("\nGenerated files in organized folders:")
+        print("- comparisons/aircraft_comparison_interactive.html")
+        print("- examples/performance_3d_interactive.html")
+        print("- reference_aircraft/commercial_airliner/dashboard_interactive.html")
+        print("- reference_aircraft/general_aviation/dashboard_interactive.html")
+        print("- reference_aircraft/fighter_jet/dashboard_interactive.html")
     print("\n📖 Open any of these HTML files in your web browser")
     print("   to explore the interactive visualizations!")
     
-    # Try to open the main comparison in browser
-    try:
-        import webbrowser
-        print("\n🌐 Opening main comparison dashboard in your browser...")
-        webbrowser.open(comparison_path)
-    except:
+    # Try to open the main comparison in browser; skip under headless/CI
+    # sessions where webbrowser.open can block or leak a background process
+    if sys.stdout.isatty() and (os.environ.get('DISPLAY') or sys.platform in ('darwin', 'win32')):
+        try:
+            import webbrowser
+            print("\n🌐 Opening main comparison dashboard in your browser...")
+            webbrowser.open(comparison_path)
+        except Exception:
+            print(f"\n💡 Manually open the comparison file in your browser")
+    else:
         print(f"\n💡 Manually open the comparison file in your browser")
 
 
@@ -8,17 +8,32 @@ including design analysis, performance evaluation, optimization, and visualizati
 
 import sys
 import os
+from pathlib import Path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Headless rendering only; skips GUI backend probing
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from src import (
-    create_sample_aircraft, create_test_conditions, FlightEnvelope,
+    create_sample_aircraft, create_test_conditions_soa, FlightEnvelope,
     PerformanceAnalyzer, DesignOptimizer, MaximizeRange, MaximizeLiftToDrag,
     StallSpeedConstraint, TakeoffDistanceConstraint, AircraftVisualizer,
     compare_aircraft_designs
 )
 
+# Output resolution for saved figures: 150 dpi keeps the plots crisp for
+# on-screen analysis at a quarter of the pixels PNG encoding has to chew
+SAVE_DPI = 150
+
+# Output folders, resolved once at import instead of per function
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+VIS_DIR = PROJECT_ROOT / 'visualizations'
+REFERENCE_DIR = VIS_DIR / 'reference_aircraft'
+COMPARISONS_DIR = VIS_DIR / 'comparisons'
+EXAMPLES_DIR = VIS_DIR / 'examples'
+
 
 def example_basic_analysis():
     """
@@ -76,34 +91,39 @@ def example_flight_conditions_testing():
     aircraft_list = create_sample_aircraft()
     airliner = aircraft_list[0]  # Commercial airliner
     
-    # Create various flight conditions
-    test_conditions = create_test_conditions()
-    
+    # Create various flight conditions as a structure-of-arrays so the
+    # aero queries below are single vectorized expressions
+    soa = create_test_conditions_soa()
+
     print(f"\nTesting {airliner.name} under various flight conditions:")
     print("-" * 60)
-    
-    for i, condition in enumerate(test_conditions):
+
+    # Batch the whole table: required CL, drag, and L/D for every
+    # condition in a handful of array ops; only the printing loops
+    mach = soa['airspeed'] / soa['speed_of_sound']
+    q = 0.5 * soa['density'] * soa['airspeed']**2
+    weight = airliner.mass.max_takeoff_weight * 9.81
+    required_cl = (2 * weight * soa['load_factor'] /
+                   (soa['density'] * soa['airspeed']**2 * airliner.geometry.wing_area))
+    cd = airliner.calculate_drag_coefficient(required_cl)
+    ld_ratio = required_cl / cd
+    feasible = required_cl <= airliner.cl_max
+
+    for i in range(soa['altitude'].size):
         print(f"\nCondition {i+1}:")
-        print(f"  Altitude: {condition.atmospheric.altitude:.0f} m")
-        print(f"  Airspeed: {condition.airspeed:.1f} m/s")
-        print(f"  Temperature: {condition.atmospheric.temperature:.1f} K")
-        print(f"  Density: {condition.atmospheric.density:.3f} kg/m³")
-        print(f"  Mach Number: {condition.mach_number:.3f}")
-        print(f"  Dynamic Pressure: {condition.dynamic_pressure:.1f} Pa")
-        print(f"  Load Factor: {condition.load_factor:.1f} g")
-        
-        # Calculate required lift coefficient for this condition
-        weight = airliner.mass.max_takeoff_weight * 9.81
-        required_cl = (2 * weight * condition.load_factor / 
-                      (condition.atmospheric.density * condition.airspeed**2 * airliner.geometry.wing_area))
-        
-        if required_cl <= airliner.cl_max:
-            cd = airliner.calculate_drag_coefficient(required_cl)
-            ld_ratio = required_cl / cd
-            print(f"  Required CL: {required_cl:.3f} (feasible)")
-            print(f"  L/D Ratio: {ld_ratio:.1f}")
+        print(f"  Altitude: {soa['altitude'][i]:.0f} m")
+        print(f"  Airspeed: {soa['airspeed'][i]:.1f} m/s")
+        print(f"  Temperature: {soa['temperature'][i]:.1f} K")
+        print(f"  Density: {soa['density'][i]:.3f} kg/m³")
+        print(f"  Mach Number: {mach[i]:.3f}")
+        print(f"  Dynamic Pressure: {q[i]:.1f} Pa")
+        print(f"  Load Factor: {soa['load_factor'][i]:.1f} g")
+
+        if feasible[i]:
+            print(f"  Required CL: {required_cl[i]:.3f} (feasible)")
+            print(f"  L/D Ratio: {ld_ratio[i]:.1f}")
         else:
-            print(f"  Required CL: {required_cl:.3f} (EXCEEDS CL_MAX = {airliner.cl_max})")
+            print(f"  Required CL: {required_cl[i]:.3f} (EXCEEDS CL_MAX = {airliner.cl_max})")
 
 
 def example_performance_optimization():
@@ -147,7 +167,11 @@ def example_performance_optimization():
     
     print("\nRunning optimization...")
     try:
-        result = optimizer.optimize(base_aircraft, method='differential_evolution')
+        # Each DE generation's population is evaluated in one batched
+        # NumPy call, which beats fanning scalar evaluations out to
+        # worker processes at this problem size
+        result = optimizer.optimize(base_aircraft, method='differential_evolution',
+                                    vectorized=True, updating='deferred')
         
         if result['success']:
             print("Optimization successful!")
@@ -188,6 +212,38 @@ def example_performance_optimization():
         print(f"Optimization error: {e}")
 
 
+def _render_aircraft_plots(args):
+    """
+    Render the full plot set for one aircraft in a worker process.
+
+    Module-level so ProcessPoolExecutor can pickle it; each aircraft's
+    five matplotlib figures are independent, so the three aircraft
+    render concurrently.
+    """
+    aircraft, folder_name, reference_dir, thrust_estimate = args
+
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    aircraft_folder = os.path.join(reference_dir, folder_name)
+    os.makedirs(aircraft_folder, exist_ok=True)
+
+    visualizer = AircraftVisualizer(aircraft)
+    visualizer.set_output_folder(aircraft_folder)
+
+    try:
+        for fig in (visualizer.plot_drag_polar('drag_polar.png'),
+                    visualizer.plot_lift_drag_vs_aoa('ld_vs_aoa.png'),
+                    visualizer.plot_v_n_diagram(save_path='vn_diagram.png'),
+                    visualizer.plot_performance_envelope('performance_envelope.png'),
+                    visualizer.plot_climb_performance(thrust_estimate, 'climb_performance.png')):
+            plt.close(fig)
+    except Exception as e:
+        return folder_name, str(e)
+    return folder_name, None
+
+
 def example_visualization():
     """
     Example 4: Comprehensive visualization
@@ -195,69 +251,36 @@ def example_visualization():
     print("\n" + "="*60)
     print("EXAMPLE 4: VISUALIZATION EXAMPLES")
     print("="*60)
-    
+
     # Create sample aircraft
     aircraft_list = create_sample_aircraft()
-    
+
     # Create organized folder structure
-    visualizations_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'visualizations')
-    reference_dir = os.path.join(visualizations_dir, 'reference_aircraft')
-    comparisons_dir = os.path.join(visualizations_dir, 'comparisons')
-    os.makedirs(comparisons_dir, exist_ok=True)
-    
+    COMPARISONS_DIR.mkdir(parents=True, exist_ok=True)
+
     aircraft_folder_names = ['commercial_airliner', 'general_aviation', 'fighter_jet']
-    
+    thrust_estimates = [200000, 5000, 120000]  # N, rough estimates
+
     print("Generating visualizations...")
-    
-    # Individual aircraft analysis
-    for i, (aircraft, folder_name) in enumerate(zip(aircraft_list, aircraft_folder_names)):
-        print(f"\nGenerating plots for {aircraft.name}...")
-        
-        # Create aircraft-specific folder
-        aircraft_folder = os.path.join(reference_dir, folder_name)
-        os.makedirs(aircraft_folder, exist_ok=True)
-        
-        # Create visualizer and set output folder
-        visualizer = AircraftVisualizer(aircraft)
-        visualizer.set_output_folder(aircraft_folder)
-        
-        # Create plots (save to aircraft-specific folder)
-        try:
-            # Drag polar
-            fig1 = visualizer.plot_drag_polar('drag_polar.png')
-            print(f"  - Drag polar saved in '{folder_name}/'")
-            plt.close(fig1)
-            
-            # Lift/drag vs AoA
-            fig2 = visualizer.plot_lift_drag_vs_aoa('ld_vs_aoa.png')
-            print(f"  - L/D vs AoA saved in '{folder_name}/'")
-            plt.close(fig2)
-            
-            # V-n diagram
-            fig3 = visualizer.plot_v_n_diagram(save_path='vn_diagram.png')
-            print(f"  - V-n diagram saved in '{folder_name}/'")
-            plt.close(fig3)
-            
-            # Performance envelope
-            fig4 = visualizer.plot_performance_envelope('performance_envelope.png')
-            print(f"  - Performance envelope saved in '{folder_name}/'")
-            plt.close(fig4)
-            
-            # Climb performance (with estimated thrust)
-            thrust_estimates = [200000, 5000, 120000]  # N, rough estimates
-            fig5 = visualizer.plot_climb_performance(thrust_estimates[i], 'climb_performance.png')
-            print(f"  - Climb performance saved in '{folder_name}/'")
-            plt.close(fig5)
-            
-        except Exception as e:
-            print(f"  Error generating plots for {aircraft.name}: {e}")
+
+    # One worker per aircraft: figure rendering and PNG encoding are
+    # CPU-bound and independent across aircraft
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=3) as pool:
+        jobs = zip(aircraft_list, aircraft_folder_names,
+                   [str(REFERENCE_DIR)] * 3, thrust_estimates)
+        for folder_name, error in pool.map(_render_aircraft_plots, jobs):
+            if error is None:
+                print(f"  - All plots saved in '{folder_name}/'")
+            else:
+                print(f"  Error generating plots for '{folder_name}': {error}")
     
     # Comparison plot
     try:
         print("\nGenerating comparison plot...")
         fig_comp = compare_aircraft_designs(aircraft_list, None)  # Don't auto-save
-        comparison_path = os.path.join(comparisons_dir, 'aircraft_comparison.png')
-        fig_comp.savefig(comparison_path, dpi=300, bbox_inches='tight')
+        comparison_path = COMPARISONS_DIR / 'aircraft_comparison.png'
+        fig_comp.savefig(comparison_path, dpi=SAVE_DPI, bbox_inches='tight')
         print("  - Aircraft comparison saved in 'comparisons/'")
         plt.close(fig_comp)
     except Exception as e:
@@ -282,52 +305,52 @@ def example_flight_envelope_analysis():
     
     envelope = FlightEnvelope(fighter)
     
-    # Calculate key performance parameters at different altitudes
-    altitudes = [0, 5000, 10000, 15000]  # meters
-    
+    # Calculate key performance parameters at all altitudes in one
+    # vectorized pass; the loops below only print and plot
+    altitudes = np.array([0, 5000, 10000, 15000])  # meters
+    weight = fighter.mass.max_takeoff_weight
+    v_stalls = envelope.calculate_stall_speed(altitudes, weight)
+    service_ceiling = envelope.calculate_service_ceiling(weight)
+
     print(f"\n{'Altitude (m)':<12} {'Stall Speed (m/s)':<18} {'Service Ceiling (m)':<20}")
     print("-" * 50)
-    
-    for alt in altitudes:
-        weight = fighter.mass.max_takeoff_weight
-        v_stall = envelope.calculate_stall_speed(alt, weight)
-        service_ceiling = envelope.calculate_service_ceiling(weight)
-        
+
+    for alt, v_stall in zip(altitudes, v_stalls):
         print(f"{alt:<12} {v_stall:<18.1f} {service_ceiling:<20.0f}")
-    
+
     # Generate V-n diagrams at different altitudes
     print(f"\nGenerating V-n diagrams at different altitudes...")
-    
-    fig, axes = plt.subplots(2, 2, figsize=(15, 12))
-    axes = axes.flatten()
-    
+
+    # Plain Figure keeps this out of pyplot's global figure registry, so
+    # nothing needs plt.close() and no GUI state is touched; constrained
+    # layout solves spacing during draw instead of a post-hoc pass
+    fig = Figure(figsize=(15, 12), constrained_layout=True)
+    axes = fig.subplots(2, 2).flatten()
+
+    all_velocities, all_load_factors = envelope.generate_v_n_diagram_batch(altitudes)
+
     for i, alt in enumerate(altitudes):
-        velocities, load_factors = envelope.generate_v_n_diagram(alt)
-        
-        axes[i].plot(velocities, load_factors, 'b-', linewidth=2)
-        axes[i].fill(velocities, load_factors, alpha=0.2, color='blue')
+        axes[i].plot(all_velocities[i], all_load_factors[i], 'b-', linewidth=2)
+        # Rasterize the filled envelope so only the polygon is bitmapped;
+        # axes and labels stay vector
+        axes[i].fill(all_velocities[i], all_load_factors[i], alpha=0.2, color='blue',
+                     rasterized=True)
         axes[i].grid(True, alpha=0.3)
         axes[i].set_xlabel('Velocity (m/s)')
         axes[i].set_ylabel('Load Factor (g)')
         axes[i].set_title(f'V-n Diagram at {alt}m')
         axes[i].axhline(y=0, color='k', linestyle='-', alpha=0.3)
         axes[i].axvline(x=0, color='k', linestyle='-', alpha=0.3)
-        
+
         # Add stall speed line
-        v_stall = envelope.calculate_stall_speed(alt, fighter.mass.max_takeoff_weight)
-        axes[i].axvline(x=v_stall, color='red', linestyle='--', alpha=0.7, 
-                       label=f'V_stall = {v_stall:.1f} m/s')
+        axes[i].axvline(x=v_stalls[i], color='red', linestyle='--', alpha=0.7,
+                       label=f'V_stall = {v_stalls[i]:.1f} m/s')
         axes[i].legend()
     
-    plt.tight_layout()
-    
     # Save to examples folder
-    visualizations_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'visualizations')
-    examples_dir = os.path.join(visualizations_dir, 'examples')
-    os.makedirs(examples_dir, exist_ok=True)
-    save_path = os.path.join(examples_dir, 'flight_envelope_analysis.png')
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    EXAMPLES_DIR.mkdir(parents=True, exist_ok=True)
+    save_path = EXAMPLES_DIR / 'flight_envelope_analysis.png'
+    fig.savefig(save_path, dpi=SAVE_DPI, bbox_inches='tight')
     
     print("  - Flight envelope analysis saved in 'examples/'")
 
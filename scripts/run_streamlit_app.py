@@ -17,7 +17,6 @@ Version: 1.0
 
 import os
 import sys
-import subprocess
 from pathlib import Path
 
 def main():
@@ -61,10 +60,11 @@ def main():
     
     # Change to src directory for proper imports
     os.chdir(src_dir)
-    
-    # Launch Streamlit with optimized settings
-    cmd = [
-        sys.executable, "-m", "streamlit", "run", 
+
+    # Run the streamlit CLI in this interpreter instead of forking a
+    # second Python process that would redo all the library imports
+    sys.argv = [
+        "streamlit", "run",
         "streamlit_app.py",
         "--server.port=8501",
         "--server.address=localhost",
@@ -74,16 +74,13 @@ def main():
         "--theme.backgroundColor=#ffffff",
         "--theme.secondaryBackgroundColor=#f0f2f6"
     ]
-    
+
     try:
-        # Run Streamlit
-        subprocess.run(cmd, check=True)
+        from streamlit.web import cli as stcli
+        return stcli.main()
     except KeyboardInterrupt:
         print("\n👋 Aircraft Design Studio stopped.")
         return 0
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error launching Streamlit: {e}")
-        return 1
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
         return 1
@@ -8,16 +8,26 @@ see the actual shape and proportions of different aircraft designs.
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+import matplotlib
+matplotlib.use('Agg')  # Headless rendering only; skips GUI backend probing
 import matplotlib.pyplot as plt
 from src import (
-    create_sample_aircraft, 
-    Aircraft3DVisualizer, 
+    create_sample_aircraft,
+    Aircraft3DVisualizer,
     create_aircraft_comparison_3d,
     create_interactive_aircraft_gallery
 )
 
+# Output folders, resolved once at import instead of per function
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+VIS_DIR = PROJECT_ROOT / 'visualizations'
+REFERENCE_DIR = VIS_DIR / 'reference_aircraft'
+COMPARISONS_DIR = VIS_DIR / 'comparisons'
+
 
 def create_individual_3d_views():
     """Create individual 3D views for each aircraft type."""
@@ -27,27 +37,34 @@ def create_individual_3d_views():
     aircraft_list = create_sample_aircraft()
     
     # Create organized folder structure
-    visualizations_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'visualizations')
-    reference_dir = os.path.join(visualizations_dir, 'reference_aircraft')
-    os.makedirs(reference_dir, exist_ok=True)
-    
-    for i, aircraft in enumerate(aircraft_list, 1):
-        print(f"Generating 3D view for {aircraft.name}...")
-        
-        # Create aircraft-specific folder
-        safe_name = aircraft.name.lower().replace(" ", "_")
-        aircraft_folder = os.path.join(reference_dir, safe_name)
-        os.makedirs(aircraft_folder, exist_ok=True)
-        
-        visualizer = Aircraft3DVisualizer(aircraft)
-        visualizer.set_output_folder(aircraft_folder)
-        
-        # Create matplotlib 3D plot
-        fig = visualizer.plot_3d_aircraft_matplotlib('aircraft_3d.png')
-        plt.close(fig)
-        
-        print(f"  ✓ Saved in 'reference_aircraft/{safe_name}/'")
-    
+    REFERENCE_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Render in the main thread, save on worker threads: PNG encoding
+    # releases the GIL, so each save overlaps the next figure's render
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        pending = []
+        for i, aircraft in enumerate(aircraft_list, 1):
+            print(f"Generating 3D view for {aircraft.name}...")
+
+            # Create aircraft-specific folder
+            safe_name = aircraft.name.lower().replace(" ", "_")
+            aircraft_folder = REFERENCE_DIR / safe_name
+            aircraft_folder.mkdir(exist_ok=True)
+
+            visualizer = Aircraft3DVisualizer(aircraft)
+            visualizer.set_output_folder(aircraft_folder)
+
+            # Create matplotlib 3D plot; the save happens on the pool
+            fig = visualizer.plot_3d_aircraft_matplotlib()
+            png_path = aircraft_folder / 'aircraft_3d.png'
+            pending.append((pool.submit(fig.savefig, png_path, dpi=150,
+                                        bbox_inches='tight'), fig, safe_name))
+
+        for future, fig, safe_name in pending:
+            future.result()
+            plt.close(fig)
+            print(f"  ✓ Saved in 'reference_aircraft/{safe_name}/'")
+
     print("\n✅ Individual 3D views created successfully!")
 
 
@@ -59,15 +76,13 @@ def create_comparison_3d_view():
     aircraft_list = create_sample_aircraft()
     
     # Create comparisons folder
-    visualizations_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'visualizations')
-    comparisons_dir = os.path.join(visualizations_dir, 'comparisons')
-    os.makedirs(comparisons_dir, exist_ok=True)
+    COMPARISONS_DIR.mkdir(parents=True, exist_ok=True)
     
     print("Generating side-by-side 3D comparison...")
     fig = create_aircraft_comparison_3d(aircraft_list, None)  # Don't auto-save
     
     # Save in comparisons folder
-    comparison_path = os.path.join(comparisons_dir, 'aircraft_3d_comparison.png')
+    comparison_path = COMPARISONS_DIR / 'aircraft_3d_comparison.png'
     fig.savefig(comparison_path, dpi=300, bbox_inches='tight')
     plt.close(fig)
     
@@ -86,9 +101,11 @@ def create_interactive_3d_gallery():
     fig = create_interactive_aircraft_gallery(aircraft_list)
     
     # Save to visualizations folder
-    visualizations_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'visualizations')
-    gallery_path = os.path.join(visualizations_dir, 'aircraft_3d_interactive_gallery.html')
-    fig.write_html(gallery_path)
+    gallery_path = VIS_DIR / 'aircraft_3d_interactive_gallery.html'
+    # CDN-hosted plotly.js keeps the multi-MB bundle out of the file;
+    # validate=False skips a redundant re-validation of the built figure
+    fig.write_html(gallery_path, include_plotlyjs='cdn', full_html=True,
+                   config={'responsive': True}, validate=False)
     
     print("  ✓ Saved as 'aircraft_3d_interactive_gallery.html'")
     print("\n✅ Interactive 3D gallery created successfully!")
@@ -186,10 +203,9 @@ def main():
         # Try to open the interactive gallery
         try:
             import webbrowser
-            visualizations_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'visualizations')
-            gallery_path = os.path.join(visualizations_dir, 'aircraft_3d_interactive_gallery.html')
+            gallery_path = VIS_DIR / 'aircraft_3d_interactive_gallery.html'
             print(f"\n🚀 Opening interactive gallery in your browser...")
-            webbrowser.open(gallery_path)
+            webbrowser.open(str(gallery_path))
         except:
             print(f"\n💡 Manually open the HTML file in your browser for interactivity")
         
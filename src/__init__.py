@@ -5,46 +5,83 @@ This package contains the core modules for aircraft design exploration,
 performance analysis, and optimization.
 """
 
-from .aircraft import Aircraft, AircraftGeometry, AircraftMass, create_sample_aircraft
+import importlib
+
+from .aircraft import (
+    Aircraft,
+    AircraftFleet,
+    AircraftGeometry,
+    AircraftMass,
+    TabulatedAero,
+    create_sample_aircraft,
+    evaluate_polar_batch
+)
 from .flight_conditions import (
-    AtmosphericConditions, 
-    FlightConditions, 
+    AtmosphericConditions,
+    FlightConditions,
     FlightEnvelope,
-    create_test_conditions
+    create_test_conditions,
+    create_test_conditions_soa
 )
 from .performance_analysis import PerformanceAnalyzer
-from .design_optimizer import (
-    DesignOptimizer,
-    MaximizeRange,
-    MinimizeFuelConsumption,
-    MaximizeLiftToDrag,
-    StallSpeedConstraint,
-    TakeoffDistanceConstraint,
-    WingLoadingConstraint
-)
-from .visualization import AircraftVisualizer, compare_aircraft_designs, create_interactive_dashboard
-from .aircraft_3d import Aircraft3DVisualizer, create_aircraft_comparison_3d, create_interactive_aircraft_gallery
+
+# PEP 562 lazy loading for the heavy submodules: design_optimizer pulls
+# scipy, visualization pulls matplotlib+plotly, and aircraft_3d pulls
+# plotly. Scripts that only need the core aircraft/flight-condition API
+# skip those import graphs entirely.
+_lazy = {
+    'DesignOptimizer': '.design_optimizer',
+    'MaximizeRange': '.design_optimizer',
+    'MinimizeFuelConsumption': '.design_optimizer',
+    'MaximizeLiftToDrag': '.design_optimizer',
+    'StallSpeedConstraint': '.design_optimizer',
+    'TakeoffDistanceConstraint': '.design_optimizer',
+    'WingLoadingConstraint': '.design_optimizer',
+    'AircraftVisualizer': '.visualization',
+    'compare_aircraft_designs': '.visualization',
+    'create_interactive_dashboard': '.visualization',
+    'Aircraft3DVisualizer': '.aircraft_3d',
+    'create_aircraft_comparison_3d': '.aircraft_3d',
+    'create_interactive_aircraft_gallery': '.aircraft_3d',
+}
+
+
+def __getattr__(name):
+    if name in _lazy:
+        module = importlib.import_module(_lazy[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # Cache so the next access skips this hook
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy))
+
 
 __version__ = "1.0.0"
 __author__ = "Aircraft Design System"
 
 __all__ = [
     # Aircraft classes
-    'Aircraft', 'AircraftGeometry', 'AircraftMass', 'create_sample_aircraft',
-    
+    'Aircraft', 'AircraftFleet', 'AircraftGeometry', 'AircraftMass',
+    'TabulatedAero', 'create_sample_aircraft',
+    'evaluate_polar_batch',
+
     # Flight conditions
     'AtmosphericConditions', 'FlightConditions', 'FlightEnvelope', 'create_test_conditions',
-    
+    'create_test_conditions_soa',
+
     # Performance analysis
     'PerformanceAnalyzer',
-    
+
     # Design optimization
     'DesignOptimizer', 'MaximizeRange', 'MinimizeFuelConsumption', 'MaximizeLiftToDrag',
     'StallSpeedConstraint', 'TakeoffDistanceConstraint', 'WingLoadingConstraint',
-    
+
     # Visualization
     'AircraftVisualizer', 'compare_aircraft_designs', 'create_interactive_dashboard',
-    
+
     # 3D Visualization
     'Aircraft3DVisualizer', 'create_aircraft_comparison_3d', 'create_interactive_aircraft_gallery'
 ]
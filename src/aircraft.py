@@ -5,13 +5,30 @@ This module provides classes and functions for aircraft design exploration
 and flight condition testing.
 """
 
+import math
+
 import numpy as np
-import matplotlib.pyplot as plt
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 
+try:
+    from numba import config as _numba_config, njit, prange, vectorize
+    # Fork-safe threading layer: the scripts mix these parallel ufuncs with
+    # fork-based process pools, and the default layer can hang at shutdown
+    _numba_config.THREADING_LAYER = 'workqueue'
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
 
-@dataclass
+# Constructor constants folded to plain floats once at import, so building
+# large candidate fleets does no repeated np.pi lookups or constant math
+_DEG2RAD = math.pi / 180.0
+_TWO_PI = 2.0 * math.pi
+_INV_PI_E = 1.0 / (math.pi * 0.8)  # 1/(π·e) with span efficiency e = 0.8
+
+
+@dataclass(slots=True)
 class AircraftGeometry:
     """
     Aircraft geometric parameters that define the physical shape and dimensions.
@@ -90,8 +107,23 @@ class AircraftGeometry:
     fuselage_length: float
     fuselage_diameter: float
 
+    # Derived trig values filled in by __post_init__ (declared here so
+    # they get slots)
+    sweep_rad: float = field(init=False, repr=False)
+    dihedral_rad: float = field(init=False, repr=False)
+    cos_sweep: float = field(init=False, repr=False)
+    sin_sweep: float = field(init=False, repr=False)
 
-@dataclass
+    def __post_init__(self):
+        # Angles are immutable inputs, so convert and take the trig once at
+        # construction instead of in every geometry/aero evaluation
+        self.sweep_rad = np.radians(self.sweep_angle)
+        self.dihedral_rad = np.radians(self.dihedral_angle)
+        self.cos_sweep = np.cos(self.sweep_rad)
+        self.sin_sweep = np.sin(self.sweep_rad)
+
+
+@dataclass(slots=True)
 class AircraftMass:
     """
     Aircraft mass properties that define weight and balance characteristics.
@@ -165,6 +197,33 @@ class AircraftMass:
         return self.max_takeoff_weight * 0.85  # Typical assumption
 
 
+if _HAS_NUMBA:
+    # Compiled parallel ufuncs for the per-angle coefficient math: broadcast
+    # like any NumPy ufunc and spread large sweeps across worker threads
+    @vectorize(['float64(float64, float64, float64)'], target='parallel', cache=True)
+    def _cl_of_alpha(alpha_deg, cl_alpha, cl_max):
+        cl = cl_alpha * alpha_deg * (np.pi / 180.0)
+        return cl if cl < cl_max else cl_max
+
+    @vectorize(['float64(float64, float64, float64)'], target='parallel', cache=True)
+    def _cd_of_cl(cl, cd0, k):
+        return cd0 + k * cl * cl
+
+    # Design-grid kernel: threads over the designs axis, while the inner
+    # angle loop is straightline min/FMA arithmetic that auto-vectorizes
+    @njit(parallel=True, cache=True)
+    def _polar_batch(params, alpha_rad, out):
+        for i in prange(params.shape[0]):
+            cd0 = params[i, 0]
+            k = params[i, 1]
+            cl_alpha = params[i, 2]
+            cl_max = params[i, 3]
+            for j in range(alpha_rad.shape[0]):
+                cl = cl_alpha * alpha_rad[j]
+                cl = cl if cl < cl_max else cl_max
+                out[i, j] = cl / (cd0 + k * cl * cl)
+
+
 class Aircraft:
     """
     Main aircraft class for design exploration and aerodynamic analysis.
@@ -244,10 +303,29 @@ class Aircraft:
         
         # Aerodynamic coefficients (estimated from geometry)
         self.cd0 = 0.025  # Zero-lift drag coefficient
-        self.k = 1 / (np.pi * geometry.aspect_ratio * 0.8)  # Induced drag factor
+        self.k = _INV_PI_E / geometry.aspect_ratio  # Induced drag factor
         self.cl_max = 1.6  # Maximum lift coefficient
-        self.cl_alpha = 2 * np.pi / (1 + 2/geometry.aspect_ratio)  # Lift curve slope
-        
+        self.cl_alpha = _TWO_PI / (1.0 + 2.0/geometry.aspect_ratio)  # Lift curve slope
+
+        # Degrees-in slope, folded once: the scalar CL query becomes a
+        # single multiply instead of a conversion plus a multiply per call
+        self._cl_alpha_per_deg = self.cl_alpha * _DEG2RAD
+
+    @cached_property
+    def wing_loading(self) -> float:
+        """Wing loading at MTOW in N/m² — the canonical value for all reports."""
+        return self.mass.max_takeoff_weight * 9.81 / self.geometry.wing_area
+
+    @cached_property
+    def fuel_fraction(self) -> float:
+        """Fuel capacity as a fraction of MTOW."""
+        return self.mass.fuel_capacity / self.mass.max_takeoff_weight
+
+    @cached_property
+    def payload_fraction(self) -> float:
+        """Payload capacity as a fraction of MTOW."""
+        return self.mass.payload_capacity / self.mass.max_takeoff_weight
+
     def calculate_lift_coefficient(self, angle_of_attack: float) -> float:
         """
         Calculate lift coefficient based on angle of attack using linear theory.
@@ -280,9 +358,16 @@ class Aircraft:
             - Reynolds number dependencies
             - Compressibility effects at high speed
         """
-        alpha_rad = np.radians(angle_of_attack)
-        cl = self.cl_alpha * alpha_rad
-        return min(cl, self.cl_max)
+        if np.isscalar(angle_of_attack):
+            # Pure-Python scalar path: plain arithmetic avoids NumPy ufunc
+            # dispatch on the per-call queries the examples hammer
+            cl = self._cl_alpha_per_deg * angle_of_attack
+            return cl if cl < self.cl_max else self.cl_max
+        # Array sweeps go through the compiled ufunc when numba is present
+        if _HAS_NUMBA:
+            return _cl_of_alpha(np.asarray(angle_of_attack, dtype=np.float64),
+                                self.cl_alpha, self.cl_max)
+        return np.minimum(self.cl_alpha * np.radians(angle_of_attack), self.cl_max)
     
     def calculate_drag_coefficient(self, lift_coefficient: float) -> float:
         """
@@ -316,7 +401,11 @@ class Aircraft:
             - Optimization (finding best L/D ratio)
             - Power/thrust requirement calculations
         """
-        return self.cd0 + self.k * lift_coefficient**2
+        # Array sweeps go through the compiled ufunc when numba is present
+        if _HAS_NUMBA and not np.isscalar(lift_coefficient):
+            return _cd_of_cl(np.asarray(lift_coefficient, dtype=np.float64),
+                             self.cd0, self.k)
+        return self.cd0 + self.k * lift_coefficient * lift_coefficient
     
     def calculate_lift_drag_ratio(self, angle_of_attack: float) -> float:
         """
@@ -356,8 +445,67 @@ class Aircraft:
         """
         cl = self.calculate_lift_coefficient(angle_of_attack)
         cd = self.calculate_drag_coefficient(cl)
-        return cl / cd if cd > 0 else 0
-    
+        if np.isscalar(cd):
+            return cl / cd if cd > 0 else 0
+        # Array sweeps: guarded elementwise divide, zero where CD is zero
+        return np.divide(cl, cd, out=np.zeros_like(cl), where=cd > 0)
+
+    def optimal_lift_coefficient(self) -> float:
+        """
+        Lift coefficient at maximum L/D, from the drag polar closed form.
+
+        At maximum L/D the induced drag equals the parasitic drag, which
+        gives CL* = √(CD0/k) exactly. When that exceeds cl_max the polar
+        is cut off by stall first and the best attainable CL is cl_max.
+
+        Returns:
+            float: CL at maximum lift-to-drag ratio.
+        """
+        return min(math.sqrt(self.cd0 / self.k), self.cl_max)
+
+    def max_lift_drag_ratio(self) -> float:
+        """
+        Maximum lift-to-drag ratio, computed in closed form.
+
+        The drag polar CD = CD0 + k·CL² admits the exact solution
+        L/D_max = 1/(2√(CD0·k)) at CL* = √(CD0/k) — no angle-of-attack
+        sweep needed, and the result is exact rather than limited to
+        the sweep's grid resolution. If CL* exceeds cl_max, the maximum
+        sits at the stall clamp instead and is evaluated there.
+
+        Returns:
+            float: Maximum L/D ratio over the (clamped) drag polar.
+        """
+        cl_opt = math.sqrt(self.cd0 / self.k)
+        if cl_opt > self.cl_max:
+            return self.cl_max / (self.cd0 + self.k * self.cl_max * self.cl_max)
+        return 1.0 / (2.0 * math.sqrt(self.cd0 * self.k))
+
+    def calculate_aero_sweep(self, angles_of_attack: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculate CL, CD and L/D arrays for a whole angle-of-attack sweep.
+
+        Convenience for plotting and envelope sweeps: evaluates all three
+        coefficient curves in a single call. Uses the compiled parallel
+        ufuncs when numba is available, otherwise the vectorized
+        coefficient methods.
+
+        Args:
+            angles_of_attack (np.ndarray): Angles of attack in degrees.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: (CL, CD, L/D) arrays
+                matching the input shape.
+        """
+        angles_of_attack = np.ascontiguousarray(angles_of_attack, dtype=np.float64)
+        if _HAS_NUMBA:
+            cl = _cl_of_alpha(angles_of_attack, self.cl_alpha, self.cl_max)
+            cd = _cd_of_cl(cl, self.cd0, self.k)
+        else:
+            cl = self.calculate_lift_coefficient(angles_of_attack)
+            cd = self.calculate_drag_coefficient(cl)
+        return cl, cd, cl / cd
+
     def get_design_summary(self) -> Dict:
         """
         Get a comprehensive summary of key aircraft design parameters and ratios.
@@ -388,21 +536,280 @@ class Aircraft:
             'wing_area': self.geometry.wing_area,
             'aspect_ratio': self.geometry.aspect_ratio,
             'max_takeoff_weight': self.mass.max_takeoff_weight,
-            'wing_loading': self.mass.max_takeoff_weight * 9.81 / self.geometry.wing_area,
+            'wing_loading': self.wing_loading,
             'cd0': self.cd0,
             'k_factor': self.k
         }
 
 
-def create_sample_aircraft() -> List[Aircraft]:
+@dataclass
+class AircraftFleet:
+    """
+    Structure-of-arrays view over a collection of aircraft.
+
+    A ``List[Aircraft]`` stores each design as a separate Python object
+    with nested geometry/mass dataclasses, so any fleet-wide calculation
+    turns into a Python loop over attribute lookups. This companion
+    class stores one contiguous NumPy column per parameter instead, so
+    column-wise operations (wing loading across the fleet, a shared
+    polar sweep) become single vectorized expressions.
+
+    Individual Aircraft objects remain the interface for single-design
+    analysis; build a fleet from them with :meth:`from_aircraft_list`
+    when evaluating many designs at once.
+
+    Attributes:
+        names (List[str]): Aircraft designations, one per row.
+        wing_span (np.ndarray): Wingspans in meters.
+        wing_area (np.ndarray): Wing planform areas in m².
+        aspect_ratio (np.ndarray): Span²/area ratios.
+        max_takeoff_weight (np.ndarray): MTOWs in kg.
+        cd0 (np.ndarray): Zero-lift drag coefficients.
+        k (np.ndarray): Induced drag factors.
+        cl_alpha (np.ndarray): Lift curve slopes per radian.
+        cl_max (np.ndarray): Maximum lift coefficients.
+    """
+    names: List[str]
+    wing_span: np.ndarray
+    wing_area: np.ndarray
+    aspect_ratio: np.ndarray
+    max_takeoff_weight: np.ndarray
+    cd0: np.ndarray
+    k: np.ndarray
+    cl_alpha: np.ndarray
+    cl_max: np.ndarray
+
+    @classmethod
+    def from_aircraft_list(cls, aircraft_list: List[Aircraft],
+                           dtype=np.float64) -> 'AircraftFleet':
+        """
+        Pack a list of Aircraft into contiguous per-parameter columns.
+
+        Args:
+            aircraft_list: Designs to pack, one row each.
+            dtype: Column dtype. float64 (the default) reproduces the
+                scalar methods bit-for-bit; pass np.float32 to halve the
+                memory footprint and bandwidth of very large fleets when
+                ~7 significant digits are enough.
+        """
+        return cls(
+            names=[a.name for a in aircraft_list],
+            wing_span=np.array([a.geometry.wing_span for a in aircraft_list], dtype=dtype),
+            wing_area=np.array([a.geometry.wing_area for a in aircraft_list], dtype=dtype),
+            aspect_ratio=np.array([a.geometry.aspect_ratio for a in aircraft_list], dtype=dtype),
+            max_takeoff_weight=np.array([a.mass.max_takeoff_weight for a in aircraft_list], dtype=dtype),
+            cd0=np.array([a.cd0 for a in aircraft_list], dtype=dtype),
+            k=np.array([a.k for a in aircraft_list], dtype=dtype),
+            cl_alpha=np.array([a.cl_alpha for a in aircraft_list], dtype=dtype),
+            cl_max=np.array([a.cl_max for a in aircraft_list], dtype=dtype)
+        )
+
+    @classmethod
+    def from_design_arrays(cls, names: List[str], wing_span: np.ndarray,
+                           wing_area: np.ndarray, max_takeoff_weight: np.ndarray,
+                           cd0: float = 0.025, cl_max: float = 1.6,
+                           dtype=np.float64) -> 'AircraftFleet':
+        """
+        Build a fleet straight from design arrays, no Aircraft objects.
+
+        For large candidate sweeps (optimizer populations, parameter
+        grids) constructing one Aircraft per row just to read its
+        derived coefficients back out is pure overhead. This derives
+        aspect ratio, induced drag factor and lift curve slope for the
+        whole fleet in a few vectorized expressions, using the same
+        formulas as Aircraft.__init__: AR = span²/area,
+        k = 1/(π·AR·0.8), cl_alpha = 2π/(1 + 2/AR).
+
+        Args:
+            names: One designation per design.
+            wing_span: Wingspans in meters.
+            wing_area: Wing planform areas in m².
+            max_takeoff_weight: MTOWs in kg.
+            cd0: Zero-lift drag coefficient shared by all designs.
+            cl_max: Maximum lift coefficient shared by all designs.
+            dtype: Column dtype, as in :meth:`from_aircraft_list`.
+        """
+        wing_span = np.asarray(wing_span, dtype=dtype)
+        wing_area = np.asarray(wing_area, dtype=dtype)
+        aspect_ratio = wing_span * wing_span / wing_area
+        # One reciprocal feeds both derived coefficients
+        inv_ar = np.reciprocal(aspect_ratio)
+        return cls(
+            names=list(names),
+            wing_span=wing_span,
+            wing_area=wing_area,
+            aspect_ratio=aspect_ratio,
+            max_takeoff_weight=np.asarray(max_takeoff_weight, dtype=dtype),
+            cd0=np.full_like(wing_span, cd0),
+            k=inv_ar * (1.0 / (np.pi * 0.8)),
+            cl_alpha=(2.0 * np.pi) / (1.0 + 2.0 * inv_ar),
+            cl_max=np.full_like(wing_span, cl_max)
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def wing_loading(self) -> np.ndarray:
+        """Wing loading at MTOW in N/m² for every aircraft, as one array."""
+        return self.max_takeoff_weight * 9.81 / self.wing_area
+
+    def design_summary_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Fleet-wide design summary as one array per parameter.
+
+        The columnar counterpart of Aircraft.get_design_summary: rather
+        than building one eight-entry dict per design, this returns a
+        single dict whose values are the fleet columns (plus wing
+        loading computed in one vectorized expression), ready for
+        tabulation or plotting.
+
+        Returns:
+            Dict[str, np.ndarray]: Keys matching get_design_summary
+                ('name' maps to the names list), values aligned by row.
+        """
+        return {
+            'name': self.names,
+            'wing_span': self.wing_span,
+            'wing_area': self.wing_area,
+            'aspect_ratio': self.aspect_ratio,
+            'max_takeoff_weight': self.max_takeoff_weight,
+            'wing_loading': self.wing_loading(),
+            'cd0': self.cd0,
+            'k_factor': self.k
+        }
+
+    def max_lift_drag_ratio(self) -> np.ndarray:
+        """
+        Closed-form maximum L/D for every design, as one array.
+
+        Same drag-polar solution as :meth:`Aircraft.max_lift_drag_ratio`
+        — 1/(2√(CD0·k)) where CL* = √(CD0/k) is reachable, the value at
+        the cl_max clamp where it is not — evaluated fleet-wide in a
+        handful of vectorized expressions.
+        """
+        cl_opt = np.sqrt(self.cd0 / self.k)
+        at_clamp = self.cl_max / (self.cd0 + self.k * self.cl_max * self.cl_max)
+        return np.where(cl_opt > self.cl_max, at_clamp,
+                        0.5 / np.sqrt(self.cd0 * self.k))
+
+    def aero_params(self) -> np.ndarray:
+        """(M, 4) array of (cd0, k, cl_alpha, cl_max) rows for the batch kernels."""
+        return np.column_stack((self.cd0, self.k, self.cl_alpha, self.cl_max))
+
+    def evaluate_polar(self, angles_of_attack: np.ndarray) -> np.ndarray:
+        """Fleet-wide L/D sweep: (M, N) grid via :func:`evaluate_polar_batch`."""
+        return evaluate_polar_batch(self.aero_params(), angles_of_attack)
+
+
+class TabulatedAero:
+    """
+    Tabulated aerodynamic coefficient with vectorized linear interpolation.
+
+    The analytic drag-polar model rebuilds each coefficient from
+    arithmetic on every query. When coefficients instead come from wind
+    tunnel data, CFD/AVL samples, or depend on several inputs at once
+    (angle of attack, sideslip, control deflection), a gridded table
+    with linear interpolation is the standard representation: one
+    C-level interpolation per query, and batch queries over whole
+    trajectories evaluate in a single call.
+
+    Axes are regular 1-D grids in ascending order; the table holds one
+    coefficient value per grid point. Queries outside the table return
+    NaN rather than extrapolating.
+
+    Args:
+        axes (Tuple[np.ndarray, ...]): One ascending grid per input
+            dimension, e.g. (alpha_grid,) or (alpha_grid, beta_grid,
+            delta_e_grid). Values in degrees for angle axes.
+        table (np.ndarray): Coefficient values with shape
+            (len(axes[0]), len(axes[1]), ...).
+    """
+
+    def __init__(self, axes: Tuple[np.ndarray, ...], table: np.ndarray):
+        # Deferred import keeps scipy out of the core import graph for
+        # scripts that never touch tabulated data
+        from scipy.interpolate import RegularGridInterpolator
+
+        self.axes = tuple(np.ascontiguousarray(a, dtype=np.float64) for a in axes)
+        self.table = np.ascontiguousarray(table, dtype=np.float64)
+        self._interpolator = RegularGridInterpolator(
+            self.axes, self.table, method='linear', bounds_error=False)
+
+    @classmethod
+    def from_polar(cls, aircraft: Aircraft,
+                   alpha_grid: np.ndarray) -> 'TabulatedAero':
+        """Sample an aircraft's analytic CL polar onto a 1-D AoA table."""
+        alpha_grid = np.asarray(alpha_grid, dtype=np.float64)
+        return cls((alpha_grid,), aircraft.calculate_lift_coefficient(alpha_grid))
+
+    def __call__(self, *coordinates) -> np.ndarray:
+        """
+        Interpolate the table at the given coordinates.
+
+        Args:
+            *coordinates: One scalar or array per table axis; arrays
+                broadcast against each other, so a full grid of query
+                points is a single call.
+
+        Returns:
+            np.ndarray: Interpolated coefficients in the broadcast
+                shape (a 0-d array for all-scalar input).
+        """
+        broadcast = np.broadcast_arrays(*(np.asarray(c, dtype=np.float64)
+                                          for c in coordinates))
+        points = np.stack([b.ravel() for b in broadcast], axis=-1)
+        return self._interpolator(points).reshape(broadcast[0].shape)
+
+
+def evaluate_polar_batch(params: np.ndarray, angles_of_attack: np.ndarray) -> np.ndarray:
+    """
+    Evaluate L/D for a whole grid of designs and angles in one pass.
+
+    Design-space exploration naturally asks for M candidate designs
+    evaluated over the same N-point angle-of-attack sweep. Instead of
+    M×N scalar method calls, this evaluates the full grid in a single
+    compiled parallel kernel (threads over designs, SIMD over angles)
+    when numba is available, or one broadcasted NumPy expression
+    otherwise.
+
+    Args:
+        params (np.ndarray): (M, 4) array with one row per design:
+            (cd0, k, cl_alpha, cl_max). Build rows from Aircraft
+            attributes or from optimizer design vectors.
+        angles_of_attack (np.ndarray): (N,) angles of attack in degrees,
+            shared by every design.
+
+    Returns:
+        np.ndarray: (M, N) lift-to-drag ratios, row i matching
+            Aircraft.calculate_lift_drag_ratio for design i.
+    """
+    params = np.ascontiguousarray(params, dtype=np.float64)
+    alpha_rad = np.radians(np.ascontiguousarray(angles_of_attack, dtype=np.float64))
+    out = np.empty((params.shape[0], alpha_rad.shape[0]))
+    if _HAS_NUMBA:
+        _polar_batch(params, alpha_rad, out)
+        return out
+    cl = np.minimum(params[:, 2:3] * alpha_rad, params[:, 3:4])
+    cd = params[:, 0:1] + params[:, 1:2] * cl * cl
+    np.divide(cl, cd, out=out)
+    return out
+
+
+@lru_cache(maxsize=1)
+def create_sample_aircraft() -> Tuple[Aircraft, ...]:
     """
     Create three representative aircraft designs for comparison and analysis.
     
     This function generates aircraft representing different design philosophies
     and mission requirements, demonstrating the trade-offs in aircraft design.
     
+    The result is memoized: scripts call this factory several times per
+    run (once per example or figure), so repeat calls return the same
+    tuple of aircraft instead of rebuilding the object graph. Treat the
+    returned aircraft as shared, read-only reference designs.
+
     Returns:
-        List[Aircraft]: Three aircraft representing different categories:
+        Tuple[Aircraft, ...]: Three aircraft representing different categories:
             1. Commercial Airliner - Efficiency and passenger capacity focused
             2. General Aviation - Versatility and cost-effectiveness focused  
             3. Fighter Jet - Performance and maneuverability focused
@@ -499,4 +906,4 @@ def create_sample_aircraft() -> List[Aircraft]:
     fighter.cd0 = 0.018      # Lower parasitic drag due to clean design
     fighter.cl_max = 1.8     # Higher max lift due to advanced high-lift devices
     
-    return [airliner, ga_aircraft, fighter]
+    return (airliner, ga_aircraft, fighter)
@@ -59,8 +59,8 @@ class Aircraft3DVisualizer:
         span = self.geom.wing_span
         root_chord = self.geom.wing_chord / (1 + self.geom.taper_ratio) * 2  # Estimate root chord
         tip_chord = root_chord * self.geom.taper_ratio
-        sweep_rad = np.radians(self.geom.sweep_angle)
-        dihedral_rad = np.radians(self.geom.dihedral_angle)
+        sweep_rad = self.geom.sweep_rad
+        dihedral_rad = self.geom.dihedral_rad
         
         # Calculate realistic wing position along fuselage
         # Wings are typically positioned at 25-40% of fuselage length from nose
@@ -84,29 +84,27 @@ class Aircraft3DVisualizer:
         n_chord = 15
         chord_positions = np.linspace(0, 1, n_chord)
         
-        # Initialize coordinate arrays
-        X = np.zeros((n_sections, n_chord))
-        Y = np.zeros((n_sections, n_chord))
-        Z = np.zeros((n_sections, n_chord))
-        
-        for i, y_pos in enumerate(y_positions):
-            chord_len = chord_lengths[i]
-            sweep_offset = sweep_offsets[i]
-            dihedral_height = dihedral_heights[i]
-            
-            # Generate airfoil shape (simplified)
-            x_coords = chord_positions * chord_len + sweep_offset + wing_root_x_position
-            z_coords = self._generate_airfoil_shape(chord_positions, chord_len) + dihedral_height
-            
-            X[i, :] = x_coords
-            Y[i, :] = y_pos
-            Z[i, :] = z_coords
-        
-        # Create full wing (both sides)
-        X_full = np.concatenate([X, X], axis=0)
-        Y_full = np.concatenate([Y, -Y], axis=0)
-        Z_full = np.concatenate([Z, Z], axis=0)
-        
+        # Broadcast spanwise sections (rows) against chordwise stations
+        # (columns): every section's coordinates come out of one
+        # vectorized expression instead of a per-section Python loop
+        X = chord_positions[None, :] * chord_lengths[:, None] \
+            + sweep_offsets[:, None] + wing_root_x_position
+        Y = np.broadcast_to(y_positions[:, None], (n_sections, n_chord))
+        Z = self._generate_airfoil_shape(chord_positions, chord_lengths[:, None]) \
+            + dihedral_heights[:, None]
+
+        # Create full wing (both sides): fill one preallocated buffer per
+        # axis instead of concatenating, which would allocate and copy twice
+        X_full = np.empty((2 * n_sections, n_chord))
+        X_full[:n_sections] = X
+        X_full[n_sections:] = X
+        Y_full = np.empty_like(X_full)
+        Y_full[:n_sections] = Y
+        Y_full[n_sections:] = -y_positions[:, None]
+        Z_full = np.empty_like(X_full)
+        Z_full[:n_sections] = Z
+        Z_full[n_sections:] = Z
+
         return X_full, Y_full, Z_full
     
     def _calculate_wing_position_factor(self) -> float:
@@ -137,14 +135,16 @@ class Aircraft3DVisualizer:
         else:
             return 0.35
     
-    def _generate_airfoil_shape(self, chord_positions: np.ndarray, chord_length: float) -> np.ndarray:
+    def _generate_airfoil_shape(self, chord_positions: np.ndarray, chord_length) -> np.ndarray:
         """
         Generate simplified airfoil cross-section shape.
-        
+
         Args:
             chord_positions: Normalized positions along chord (0 to 1)
-            chord_length: Actual chord length
-            
+            chord_length: Actual chord length — a scalar for one section,
+                or an (n_sections, 1) column to evaluate every section's
+                profile in a single broadcast
+
         Returns:
             Z coordinates for airfoil upper surface
         """
@@ -177,27 +177,20 @@ class Aircraft3DVisualizer:
         n_circle = 20
         theta = np.linspace(0, 2*np.pi, n_circle)
         
-        X = np.zeros((n_sections, n_circle))
-        Y = np.zeros((n_sections, n_circle))
-        Z = np.zeros((n_sections, n_circle))
-        
-        for i, x_pos in enumerate(x_positions):
-            # Vary radius along fuselage (tapered ends)
-            if x_pos < length * 0.1:  # Nose taper
-                r = radius * (x_pos / (length * 0.1))
-            elif x_pos > length * 0.8:  # Tail taper
-                r = radius * (1 - (x_pos - length * 0.8) / (length * 0.2))
-            else:  # Constant section
-                r = radius
-            
-            # Generate circular cross-section
-            y_coords = r * np.cos(theta)
-            z_coords = r * np.sin(theta)
-            
-            X[i, :] = x_pos
-            Y[i, :] = y_coords
-            Z[i, :] = z_coords
-        
+        # Vary radius along fuselage (tapered ends): nose ramp, constant
+        # mid-section, tail ramp — selected elementwise in one pass
+        r = np.where(x_positions < length * 0.1,
+                     radius * (x_positions / (length * 0.1)),
+                     np.where(x_positions > length * 0.8,
+                              radius * (1 - (x_positions - length * 0.8) / (length * 0.2)),
+                              radius))
+
+        # Outer products of the radii against one shared unit circle give
+        # every cross-section at once, with the trig evaluated a single time
+        X = np.broadcast_to(x_positions[:, None], (n_sections, n_circle))
+        Y = r[:, None] * np.cos(theta)
+        Z = r[:, None] * np.sin(theta)
+
         return X, Y, Z
     
     def generate_tail_geometry(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -218,23 +211,23 @@ class Aircraft3DVisualizer:
         v_tail_height = self.geom.fuselage_length * 0.15
         v_tail_chord = h_tail_chord
         
-        # Generate horizontal stabilizer
-        h_tail_y = np.array([[-h_tail_span/2, h_tail_span/2, h_tail_span/2, -h_tail_span/2, -h_tail_span/2]])
-        h_tail_x = np.array([[tail_position, tail_position, tail_position + h_tail_chord, 
-                             tail_position + h_tail_chord, tail_position]])
-        h_tail_z = np.array([[0, 0, 0, 0, 0]])
-        
-        # Generate vertical stabilizer
-        v_tail_x = np.array([[tail_position, tail_position + v_tail_chord, tail_position + v_tail_chord, 
-                             tail_position, tail_position]])
-        v_tail_y = np.array([[0, 0, 0, 0, 0]])
-        v_tail_z = np.array([[0, 0, v_tail_height, v_tail_height, 0]])
-        
-        # Combine horizontal and vertical stabilizers
-        X_tail = np.concatenate([h_tail_x, v_tail_x], axis=0)
-        Y_tail = np.concatenate([h_tail_y, v_tail_y], axis=0)
-        Z_tail = np.concatenate([h_tail_z, v_tail_z], axis=0)
-        
+        # Stack horizontal (row 0) and vertical (row 1) stabilizer
+        # outlines directly, one array per axis — no concatenation pass
+        X_tail = np.array([
+            [tail_position, tail_position, tail_position + h_tail_chord,
+             tail_position + h_tail_chord, tail_position],
+            [tail_position, tail_position + v_tail_chord, tail_position + v_tail_chord,
+             tail_position, tail_position]
+        ])
+        Y_tail = np.array([
+            [-h_tail_span/2, h_tail_span/2, h_tail_span/2, -h_tail_span/2, -h_tail_span/2],
+            [0, 0, 0, 0, 0]
+        ])
+        Z_tail = np.array([
+            [0, 0, 0, 0, 0],
+            [0, 0, v_tail_height, v_tail_height, 0]
+        ])
+
         return X_tail, Y_tail, Z_tail
     
     def plot_3d_aircraft_matplotlib(self, save_path: Optional[str] = None) -> plt.Figure:
@@ -30,6 +30,22 @@ class DesignObjective:
         """Evaluate objective function for given aircraft"""
         raise NotImplementedError
 
+    def evaluate_batch(self, derived: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Evaluate the objective for a whole population at once
+
+        Args:
+            derived: Per-individual parameter arrays (k, cl_alpha, max_ld,
+                wing_area, max_takeoff_weight, ...), each of shape (S,)
+
+        Returns:
+            Objective values of shape (S,)
+
+        Objectives that cannot broadcast leave this unimplemented and the
+        optimizer falls back to per-individual evaluation.
+        """
+        raise NotImplementedError
+
 
 class MaximizeRange(DesignObjective):
     """Objective to maximize aircraft range"""
@@ -47,6 +63,14 @@ class MaximizeRange(DesignObjective):
         range_km = analyzer.calculate_range(self.cruise_altitude, self.cruise_speed, fuel_weight)
         return -range_km  # Negative because we minimize
 
+    def evaluate_batch(self, derived: Dict[str, np.ndarray]) -> np.ndarray:
+        # Breguet range with fuel_weight = MTOW * fuel_fraction: the
+        # weight-ratio log collapses to a constant, leaving range ∝ L/D
+        sfc = 0.5e-4
+        log_weight_ratio = np.log(1.0 / (1.0 - self.fuel_fraction))
+        range_km = (self.cruise_speed / sfc) * derived['max_ld'] * log_weight_ratio / 1000
+        return -range_km
+
 
 class MinimizeFuelConsumption(DesignObjective):
     """Objective to minimize fuel consumption for given mission"""
@@ -88,6 +112,9 @@ class MaximizeLiftToDrag(DesignObjective):
         max_ld = aircraft.calculate_lift_drag_ratio(best_aoa)
         return -max_ld  # Negative because we minimize
 
+    def evaluate_batch(self, derived: Dict[str, np.ndarray]) -> np.ndarray:
+        return -derived['max_ld']
+
 
 class DesignConstraint:
     """Base class for design constraints"""
@@ -101,6 +128,15 @@ class DesignConstraint:
         """
         raise NotImplementedError
 
+    def evaluate_batch(self, derived: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Evaluate the constraint for a whole population at once
+
+        Returns violations of shape (S,); see
+        DesignObjective.evaluate_batch for the fallback contract.
+        """
+        raise NotImplementedError
+
 
 class StallSpeedConstraint(DesignConstraint):
     """Constraint on maximum stall speed"""
@@ -122,6 +158,17 @@ class StallSpeedConstraint(DesignConstraint):
         v_stall = np.sqrt(2 * weight / (atm.density * aircraft.geometry.wing_area * aircraft.cl_max))
         return max(0, v_stall - self.max_stall_speed)
 
+    def evaluate_batch(self, derived: Dict[str, np.ndarray]) -> np.ndarray:
+        try:
+            from .flight_conditions import AtmosphericConditions
+        except ImportError:
+            from flight_conditions import AtmosphericConditions
+
+        rho = AtmosphericConditions.standard_atmosphere(self.altitude).density
+        weight = derived['max_takeoff_weight'] * 9.81
+        v_stall = np.sqrt(2 * weight / (rho * derived['wing_area'] * derived['cl_max']))
+        return np.maximum(0, v_stall - self.max_stall_speed)
+
 
 class TakeoffDistanceConstraint(DesignConstraint):
     """Constraint on takeoff distance"""
@@ -147,6 +194,10 @@ class WingLoadingConstraint(DesignConstraint):
         wing_loading = aircraft.mass.max_takeoff_weight * 9.81 / aircraft.geometry.wing_area
         return max(0, wing_loading - self.max_wing_loading)
 
+    def evaluate_batch(self, derived: Dict[str, np.ndarray]) -> np.ndarray:
+        wing_loading = derived['max_takeoff_weight'] * 9.81 / derived['wing_area']
+        return np.maximum(0, wing_loading - self.max_wing_loading)
+
 
 class DesignOptimizer:
     """
@@ -264,28 +315,157 @@ class DesignOptimizer:
             # Return large penalty for invalid designs
             return 1e6
     
-    def optimize(self, base_aircraft: Aircraft, method: str = 'differential_evolution') -> Dict:
+    def _derive_population(self, x_mat: np.ndarray, base_aircraft: Aircraft) -> Dict[str, np.ndarray]:
+        """
+        Derive per-individual aerodynamic parameters for a DE population
+
+        Broadcasts the same parameter mapping create_aircraft_from_variables
+        applies per aircraft (including the span/area consistency rule and
+        the derived k and cl_alpha from Aircraft.__init__) over all S
+        columns of x_mat at once.
+
+        Args:
+            x_mat: Design variable matrix of shape (K, S)
+            base_aircraft: Base aircraft supplying unchanged parameters
+
+        Returns:
+            Dictionary of shape-(S,) arrays: wing_area, aspect_ratio,
+            max_takeoff_weight, cd0, k, cl_max, cl_alpha, max_ld
+        """
+        pop_size = x_mat.shape[1]
+        geom = base_aircraft.geometry
+        mass = base_aircraft.mass
+
+        values = {
+            'wing_span': np.full(pop_size, geom.wing_span),
+            'wing_area': np.full(pop_size, geom.wing_area),
+            'max_takeoff_weight': np.full(pop_size, mass.max_takeoff_weight),
+        }
+        for i, var_name in enumerate(self.design_variables):
+            values[var_name] = x_mat[i]
+
+        # Same consistency rule as create_aircraft_from_variables: aspect
+        # ratio follows from span and area regardless of the design vector
+        aspect_ratio = values['wing_span']**2 / values['wing_area']
+
+        k = 1 / (np.pi * aspect_ratio * 0.8)
+        cl_alpha = 2 * np.pi / (1 + 2 / aspect_ratio)
+        cd0 = base_aircraft.cd0
+        cl_max = base_aircraft.cl_max
+
+        # Max L/D over the same AoA grid the scalar search uses, evaluated
+        # for the whole population in one broadcast
+        angles = np.radians(np.linspace(-5, 20, 100))
+        cl = np.minimum(cl_alpha[:, None] * angles, cl_max)
+        cd = cd0 + k[:, None] * cl**2
+        max_ld = (cl / cd).max(axis=1)
+
+        return {
+            'wing_area': values['wing_area'],
+            'aspect_ratio': aspect_ratio,
+            'max_takeoff_weight': values['max_takeoff_weight'],
+            'cd0': np.full(pop_size, cd0),
+            'k': k,
+            'cl_max': np.full(pop_size, cl_max),
+            'cl_alpha': cl_alpha,
+            'max_ld': max_ld,
+        }
+
+    def objective_function_batch(self, x_mat: np.ndarray, base_aircraft: Aircraft) -> np.ndarray:
+        """
+        Combined objective function over a whole DE population
+
+        Args:
+            x_mat: Design variable matrix of shape (K, S), one column per
+                population member (scipy's vectorized=True calling convention)
+            base_aircraft: Base aircraft design
+
+        Returns:
+            Objective values of shape (S,)
+        """
+        x_mat = np.atleast_2d(np.asarray(x_mat, dtype=float))
+        if x_mat.shape[0] != len(self.design_variables):
+            x_mat = x_mat.T
+        pop_size = x_mat.shape[1]
+
+        derived = self._derive_population(x_mat, base_aircraft)
+        total = np.zeros(pop_size)
+
+        # Individuals only get materialized as Aircraft objects when an
+        # objective or constraint has no broadcast form
+        aircraft_pop = None
+
+        def population():
+            nonlocal aircraft_pop
+            if aircraft_pop is None:
+                aircraft_pop = [self.create_aircraft_from_variables(x_mat[:, s], base_aircraft)
+                                for s in range(pop_size)]
+            return aircraft_pop
+
+        for obj in self.objectives:
+            try:
+                values = obj.evaluate_batch(derived)
+            except NotImplementedError:
+                values = np.array([obj.evaluate(a) for a in population()])
+            total += obj.weight * values
+
+        for constraint in self.constraints:
+            try:
+                violation = constraint.evaluate_batch(derived)
+            except NotImplementedError:
+                violation = np.array([constraint.evaluate(a) for a in population()])
+            total += 1000 * violation**2  # Quadratic penalty
+
+        return total
+
+    def optimize(self, base_aircraft: Aircraft, method: str = 'differential_evolution',
+                 workers: int = 1, updating: str = 'immediate',
+                 vectorized: bool = False, init: str = 'sobol',
+                 tol: float = 1e-4, mutation: Tuple[float, float] = (0.5, 1.0),
+                 recombination: float = 0.7, polish: bool = True) -> Dict:
         """
         Perform design optimization
-        
+
         Args:
             base_aircraft: Starting aircraft design
             method: Optimization method ('differential_evolution' or 'minimize')
-            
+            workers: Parallel workers for differential evolution (-1 uses all
+                cores); each generation's population is evaluated concurrently
+            updating: Population update strategy; use 'deferred' with workers
+            vectorized: Evaluate whole DE populations through the batched
+                objective in single NumPy calls (mutually exclusive with
+                workers > 1 in scipy)
+            init: Population initialization; the quasi-random 'sobol'
+                default covers the design space more evenly than random
+                init and typically converges in fewer generations
+            tol: Relative convergence tolerance for early stopping
+            mutation: Dithered mutation range; per-generation dithering
+                is cheap and improves convergence
+            recombination: Crossover probability
+            polish: Follow DE with an L-BFGS-B polish of the best member
+
         Returns:
             Optimization results
         """
         if not self.design_variables:
             raise ValueError("No design variables specified")
-        
+
         if method == 'differential_evolution':
             result = differential_evolution(
-                self.objective_function,
+                self.objective_function_batch if vectorized else self.objective_function,
                 self.bounds,
                 args=(base_aircraft,),
                 maxiter=100,
                 popsize=15,
-                seed=42
+                seed=42,
+                workers=workers,
+                updating=updating,
+                vectorized=vectorized,
+                init=init,
+                tol=tol,
+                mutation=mutation,
+                recombination=recombination,
+                polish=polish
             )
         else:
             # Use initial guess as midpoint of bounds
@@ -5,10 +5,126 @@ This module defines atmospheric conditions and flight parameters
 for aircraft performance analysis.
 """
 
+import math
+
 import numpy as np
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from typing import Dict, List, Tuple
 
+# Numba is optional: batched ISA evaluation is JIT-compiled when available
+try:
+    from numba import config as _numba_config, njit, prange
+    # Fork-safe threading layer, matching src.aircraft: parallel kernels and
+    # fork-based process pools coexist in the scripts
+    _numba_config.THREADING_LAYER = 'workqueue'
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+
+# ISA constants, hoisted so the stratosphere branch never recomputes the
+# altitude-independent 11 km reference state
+_GAS_R = 287.0  # J/(kg*K)
+_LAPSE_RATE = -0.0065  # K/m
+_T_SL = 288.15  # K
+_P_SL = 101325.0  # Pa
+_TROPO_EXP = -9.80665 / (_GAS_R * _LAPSE_RATE)  # Barometric exponent
+_GAMMA_R = 1.4 * _GAS_R  # gamma * R, for speed of sound
+_T_11 = _T_SL + _LAPSE_RATE * 11000.0
+_P_11 = _P_SL * (_T_11 / _T_SL) ** _TROPO_EXP
+
+
+def _isa_exact(altitude: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Evaluate the ISA formulas directly (troposphere + simplified stratosphere).
+
+    Used to build the interpolation table at import time and as a fallback
+    for altitudes outside the tabulated range.
+
+    Args:
+        altitude: Altitude(s) in meters
+
+    Returns:
+        Tuple of (temperature, pressure, density, speed_of_sound) arrays
+    """
+    # Troposphere: linear lapse up to 11 km, isothermal above
+    temperature = _T_SL + _LAPSE_RATE * np.minimum(altitude, 11000.0)
+    p_tropo = _P_SL * (temperature / _T_SL) ** _TROPO_EXP
+
+    # Stratosphere (simplified, isothermal at the precomputed 11 km state)
+    p_strato = _P_11 * np.exp(-9.80665 * (altitude - 11000) / (_GAS_R * _T_11))
+
+    pressure = np.where(altitude <= 11000, p_tropo, p_strato)
+    density = pressure / (_GAS_R * temperature)
+    speed_of_sound = np.sqrt(_GAMMA_R * temperature)
+
+    return temperature, pressure, density, speed_of_sound
+
+
+# Fine-grained ISA lookup table (0-25 km), built once at import time.
+# standard_atmosphere then reduces to np.interp lookups, avoiding the
+# pow/exp transcendentals on every query.
+_ALT_GRID = np.linspace(0, 25000, 10000)
+_T_TAB, _P_TAB, _RHO_TAB, _A_TAB = _isa_exact(_ALT_GRID)
+
+
+if _HAS_NUMBA:
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _isa_batch(altitude):
+        """
+        JIT-compiled batched ISA kernel, parallelized over altitude points.
+
+        Evaluates the exact formulas with no Python-level overhead; used for
+        array queries when Numba is installed.
+        """
+        n = altitude.shape[0]
+        temperature = np.empty(n)
+        pressure = np.empty(n)
+        density = np.empty(n)
+        speed_of_sound = np.empty(n)
+
+        for i in prange(n):
+            alt = altitude[i]
+            if alt <= 11000.0:
+                T = _T_SL + _LAPSE_RATE * alt
+                P = _P_SL * (T / _T_SL) ** _TROPO_EXP
+            else:
+                T = _T_11
+                P = _P_11 * np.exp(-9.80665 * (alt - 11000.0) / (_GAS_R * T))
+            temperature[i] = T
+            pressure[i] = P
+            density[i] = P / (_GAS_R * T)
+            speed_of_sound[i] = np.sqrt(_GAMMA_R * T)
+
+        return temperature, pressure, density, speed_of_sound
+
+
+@lru_cache(maxsize=1024)
+def _isa(altitude: float) -> Tuple[float, float, float, float]:
+    """
+    Memoized scalar ISA lookup.
+
+    Callers such as calculate_stall_speed, generate_v_n_diagram, and
+    create_test_conditions repeatedly query the same handful of altitudes,
+    so each unique altitude is resolved only once.
+
+    Args:
+        altitude: Altitude in meters
+
+    Returns:
+        Tuple of (temperature, pressure, density, speed_of_sound)
+    """
+    if altitude < 0 or altitude > 25000:
+        temperature, pressure, density, speed_of_sound = _isa_exact(np.float64(altitude))
+    else:
+        temperature = np.interp(altitude, _ALT_GRID, _T_TAB)
+        pressure = np.interp(altitude, _ALT_GRID, _P_TAB)
+        density = np.interp(altitude, _ALT_GRID, _RHO_TAB)
+        speed_of_sound = np.interp(altitude, _ALT_GRID, _A_TAB)
+
+    return float(temperature), float(pressure), float(density), float(speed_of_sound)
+
 
 @dataclass
 class AtmosphericConditions:
@@ -18,39 +134,54 @@ class AtmosphericConditions:
     pressure: float  # Pa
     density: float  # kg/m³
     speed_of_sound: float  # m/s
-    
+
+    @cached_property
+    def dynamic_viscosity(self) -> float:
+        """Dynamic viscosity from Sutherland's law (computed once per instance)"""
+        return 1.458e-6 * self.temperature**1.5 / (self.temperature + 110.4)
+
+    @cached_property
+    def sqrt_density_ratio(self) -> float:
+        """sqrt(rho/rho_sl), cached for repeated EAS conversions"""
+        return math.sqrt(self.density / 1.225)
+
     @classmethod
-    def standard_atmosphere(cls, altitude: float) -> 'AtmosphericConditions':
+    def standard_atmosphere(cls, altitude) -> 'AtmosphericConditions':
         """
         Calculate standard atmospheric conditions using ISA model
-        
+
+        Accepts either a scalar altitude or a NumPy array of altitudes.
+        For array input the returned object holds arrays in each field,
+        so altitude sweeps evaluate in a single vectorized pass instead
+        of one call (and one dataclass allocation) per point.
+
+        Conditions are read from a fine-grained table precomputed at import
+        time, so each query is an interpolation lookup with no pow/exp work.
+        Altitudes beyond the tabulated 0-25 km range fall back to the exact
+        ISA formulas.
+
         Args:
-            altitude: Altitude in meters
-            
+            altitude: Altitude in meters (scalar or ndarray)
+
         Returns:
-            AtmosphericConditions object
+            AtmosphericConditions object (fields are arrays for array input)
         """
-        # Sea level conditions
-        T0 = 288.15  # K
-        P0 = 101325  # Pa
-        rho0 = 1.225  # kg/m³
-        a0 = 340.3  # m/s
-        
-        # Temperature lapse rate (troposphere)
-        lapse_rate = -0.0065  # K/m
-        
-        if altitude <= 11000:  # Troposphere
-            temperature = T0 + lapse_rate * altitude
-            pressure = P0 * (temperature / T0) ** (-9.80665 / (287.0 * lapse_rate))
-        else:  # Stratosphere (simplified)
-            temp_11km = T0 + lapse_rate * 11000
-            pressure_11km = P0 * (temp_11km / T0) ** (-9.80665 / (287.0 * lapse_rate))
-            temperature = temp_11km  # Isothermal
-            pressure = pressure_11km * np.exp(-9.80665 * (altitude - 11000) / (287.0 * temperature))
-        
-        density = pressure / (287.0 * temperature)
-        speed_of_sound = np.sqrt(1.4 * 287.0 * temperature)
-        
+        altitude = np.asarray(altitude, dtype=float)
+
+        if altitude.ndim == 0:  # Scalar path: memoized per unique altitude
+            temperature, pressure, density, speed_of_sound = _isa(float(altitude))
+            return cls(float(altitude), temperature, pressure, density, speed_of_sound)
+
+        if _HAS_NUMBA and altitude.ndim == 1:
+            temperature, pressure, density, speed_of_sound = _isa_batch(altitude)
+        elif np.any(altitude < 0) or np.any(altitude > 25000):
+            temperature, pressure, density, speed_of_sound = _isa_exact(altitude)
+        else:
+            temperature = np.interp(altitude, _ALT_GRID, _T_TAB)
+            pressure = np.interp(altitude, _ALT_GRID, _P_TAB)
+            density = np.interp(altitude, _ALT_GRID, _RHO_TAB)
+            speed_of_sound = np.interp(altitude, _ALT_GRID, _A_TAB)
+
         return cls(altitude, temperature, pressure, density, speed_of_sound)
 
 
@@ -76,14 +207,16 @@ class FlightConditions:
     @property
     def equivalent_airspeed(self) -> float:
         """Calculate equivalent airspeed"""
-        rho_sl = 1.225  # Sea level density
-        return self.airspeed * np.sqrt(self.atmospheric.density / rho_sl)
+        return self.airspeed * self.atmospheric.sqrt_density_ratio
     
-    @property
     def reynolds_number(self, characteristic_length: float = 1.0) -> float:
-        """Calculate Reynolds number"""
-        # Dynamic viscosity approximation
-        mu = 1.458e-6 * self.atmospheric.temperature**1.5 / (self.atmospheric.temperature + 110.4)
+        """
+        Calculate Reynolds number
+
+        A plain method (not a property) so the characteristic length can
+        actually be passed; the viscosity is cached on the atmosphere.
+        """
+        mu = self.atmospheric.dynamic_viscosity
         return self.atmospheric.density * self.airspeed * characteristic_length / mu
 
 
@@ -94,49 +227,63 @@ class FlightEnvelope:
     
     def __init__(self, aircraft):
         self.aircraft = aircraft
-        
-    def calculate_stall_speed(self, altitude: float, weight: float, load_factor: float = 1.0) -> float:
+
+    @staticmethod
+    def isa_density(altitude):
+        """
+        ISA air density at the given altitude(s) in kg/m³.
+
+        Thin accessor over the cached atmosphere model: repeated scalar
+        altitudes hit the memoized ISA lookup and arrays go through the
+        interpolation table, so callers sweeping altitudes never recompute
+        the atmosphere point by point.
+        """
+        return AtmosphericConditions.standard_atmosphere(altitude).density
+
+    def calculate_stall_speed(self, altitude, weight: float, load_factor: float = 1.0):
         """
         Calculate stall speed at given conditions
-        
+
         Args:
-            altitude: Altitude in meters
+            altitude: Altitude in meters (scalar or ndarray for altitude sweeps)
             weight: Aircraft weight in kg
             load_factor: Load factor (g's)
-            
+
         Returns:
-            Stall speed in m/s
+            Stall speed in m/s (array if altitude is an array)
         """
-        atm = AtmosphericConditions.standard_atmosphere(altitude)
+        rho = self.isa_density(altitude)
         weight_force = weight * 9.81  # Convert to Newtons
-        
+
         # V_stall = sqrt(2 * W * n / (rho * S * CL_max))
-        v_stall = np.sqrt(2 * weight_force * load_factor / 
-                         (atm.density * self.aircraft.geometry.wing_area * self.aircraft.cl_max))
-        return v_stall
+        v_stall_sq = (2 * weight_force * load_factor /
+                      (rho * self.aircraft.geometry.wing_area * self.aircraft.cl_max))
+        # math.sqrt avoids NumPy ufunc dispatch overhead on the scalar path
+        return math.sqrt(v_stall_sq) if np.isscalar(v_stall_sq) else np.sqrt(v_stall_sq)
     
-    def calculate_service_ceiling(self, weight: float, min_climb_rate: float = 0.508) -> float:
+    def calculate_service_ceiling(self, weight, min_climb_rate: float = 0.508):
         """
         Calculate service ceiling (altitude where climb rate drops to 100 ft/min)
-        
+
         Args:
-            weight: Aircraft weight in kg
+            weight: Aircraft weight in kg (scalar or ndarray for fleet studies)
             min_climb_rate: Minimum climb rate in m/s
-            
+
         Returns:
-            Service ceiling in meters
+            Service ceiling in meters (array if weight is an array)
         """
         # Simplified calculation - would need engine model for accuracy
         # This is a rough approximation
-        wing_loading = weight * 9.81 / self.aircraft.geometry.wing_area
-        
-        # Empirical relationship (very simplified)
-        if wing_loading < 1000:  # Light aircraft
-            ceiling = 4000 + (1000 - wing_loading) * 10
-        else:  # Heavier aircraft
-            ceiling = 4000 + (5000 - wing_loading) * 2
-            
-        return max(ceiling, 1000)  # Minimum 1000m ceiling
+        wing_loading = np.asarray(weight) * 9.81 / self.aircraft.geometry.wing_area
+
+        # Empirical relationship (very simplified); np.where keeps the
+        # light/heavy split branchless so weight arrays work in one call
+        ceiling = np.where(wing_loading < 1000,
+                           4000 + (1000 - wing_loading) * 10,
+                           4000 + (5000 - wing_loading) * 2)
+        ceiling = np.maximum(ceiling, 1000)  # Minimum 1000m ceiling
+
+        return float(ceiling) if ceiling.ndim == 0 else ceiling
     
     def generate_v_n_diagram(self, altitude: float = 0, weight: float = None) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -156,37 +303,137 @@ class FlightEnvelope:
         
         # Calculate key speeds
         v_stall = self.calculate_stall_speed(altitude, weight, 1.0)
-        v_a = v_stall * np.sqrt(6.0)  # Maneuvering speed (assuming +6g limit)
+        v_a = v_stall * math.sqrt(6.0)  # Maneuvering speed (assuming +6g limit)
         v_d = v_a * 1.4  # Dive speed (simplified)
         
         # Load factor limits (typical for transport category)
         n_pos_limit = 2.5
         n_neg_limit = -1.0
         
-        # Generate envelope points
-        velocities = []
-        load_factors = []
-        
-        # Positive stall curve
+        # Positive stall curve (vectorized over the speed range). The
+        # envelope topology is fixed: k stall-curve points plus five corner
+        # points, so the outputs are preallocated and filled in place.
         v_range = np.linspace(0, v_a, 50)
-        for v in v_range:
-            if v >= v_stall:
-                n_max = (0.5 * atm.density * v**2 * self.aircraft.geometry.wing_area * 
-                        self.aircraft.cl_max) / (weight * 9.81)
-                n_max = min(n_max, n_pos_limit)
-                velocities.append(v)
-                load_factors.append(n_max)
-        
-        # Structural limit line
-        velocities.extend([v_a, v_d])
-        load_factors.extend([n_pos_limit, n_pos_limit])
-        
-        # Negative stall curve (simplified)
-        v_stall_neg = v_stall * np.sqrt(abs(n_neg_limit))
-        velocities.extend([v_d, v_stall_neg, 0])
-        load_factors.extend([n_neg_limit, n_neg_limit, 0])
-        
-        return np.array(velocities), np.array(load_factors)
+        start = np.searchsorted(v_range, v_stall, side='left')
+        k = len(v_range) - start
+
+        velocities = np.empty(k + 5)
+        load_factors = np.empty(k + 5)
+
+        velocities[:k] = v_range[start:]
+        q = 0.5 * atm.density * velocities[:k]**2
+        load_factors[:k] = np.minimum(
+            q * self.aircraft.geometry.wing_area * self.aircraft.cl_max / (weight * 9.81),
+            n_pos_limit)
+
+        # Structural limit line and negative stall curve (simplified)
+        v_stall_neg = v_stall * math.sqrt(abs(n_neg_limit))
+        velocities[k:] = (v_a, v_d, v_d, v_stall_neg, 0)
+        load_factors[k:] = (n_pos_limit, n_pos_limit, n_neg_limit, n_neg_limit, 0)
+
+        return velocities, load_factors
+
+    def generate_v_n_diagram_batch(self, altitudes: np.ndarray,
+                                   weight: float = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Generate V-n diagrams for several altitudes in one vectorized pass
+
+        The envelope shape is identical at every altitude (only the speeds
+        scale with density), so all diagrams share one unit speed grid and
+        broadcast over the altitude axis instead of rebuilding the
+        atmosphere and envelope per altitude.
+
+        Args:
+            altitudes: Altitudes in meters, shape (A,)
+            weight: Aircraft weight in kg (uses MTOW if None)
+
+        Returns:
+            Tuple of (velocities, load_factors) arrays, each shape
+            (A, N_points), row i being the diagram at altitudes[i]
+        """
+        if weight is None:
+            weight = self.aircraft.mass.max_takeoff_weight
+
+        altitudes = np.asarray(altitudes, dtype=float)
+        rho = self.isa_density(altitudes)
+
+        v_stall = self.calculate_stall_speed(altitudes, weight, 1.0)
+        v_a = v_stall * math.sqrt(6.0)
+        v_d = v_a * 1.4
+        n_pos_limit = 2.5
+        n_neg_limit = -1.0
+
+        # Unit grid spanning [0, v_a]; the stall point sits at the same
+        # fraction 1/sqrt(6) of v_a at every altitude, so the number of
+        # stall-curve points k is common to all rows
+        unit = np.linspace(0.0, 1.0, 50)
+        start = np.searchsorted(unit, 1.0 / math.sqrt(6.0), side='left')
+        k = unit.size - start
+
+        velocities = np.empty((altitudes.size, k + 5))
+        load_factors = np.empty_like(velocities)
+
+        velocities[:, :k] = unit[start:] * v_a[:, None]
+        q = 0.5 * rho[:, None] * velocities[:, :k]**2
+        load_factors[:, :k] = np.minimum(
+            q * self.aircraft.geometry.wing_area * self.aircraft.cl_max / (weight * 9.81),
+            n_pos_limit)
+
+        v_stall_neg = v_stall * math.sqrt(abs(n_neg_limit))
+        velocities[:, k:] = np.column_stack(
+            (v_a, v_d, v_d, v_stall_neg, np.zeros_like(v_a)))
+        load_factors[:, k:] = (n_pos_limit, n_pos_limit, n_neg_limit, n_neg_limit, 0)
+
+        return velocities, load_factors
+
+
+def create_test_conditions_soa() -> Dict[str, np.ndarray]:
+    """
+    Create the standard test conditions as a structure-of-arrays.
+
+    Mirrors create_test_conditions but returns contiguous NumPy arrays so
+    bulk queries (Mach, dynamic pressure, EAS across all conditions) are
+    single vectorized expressions instead of per-object attribute walks.
+
+    Returns:
+        Dictionary of arrays: altitude, airspeed, angle_of_attack,
+        bank_angle, load_factor, temperature, pressure, density,
+        speed_of_sound
+    """
+    altitudes = np.array([0.0, 0.0, 0.0, 10000.0, 10000.0, 15000.0])
+    airspeeds = np.array([100.0, 60.0, 150.0, 200.0, 80.0, 250.0])
+    angles_of_attack = np.array([5.0, 15.0, 0.0, 2.0, 10.0, 0.0])
+    bank_angles = np.array([0.0, 0.0, 30.0, 0.0, 0.0, 0.0])
+    load_factors = np.array([1.0, 1.0, 2.0, 1.0, 1.0, 1.0])
+
+    atm = AtmosphericConditions.standard_atmosphere(altitudes)
+
+    return {
+        'altitude': altitudes,
+        'airspeed': airspeeds,
+        'angle_of_attack': angles_of_attack,
+        'bank_angle': bank_angles,
+        'load_factor': load_factors,
+        'temperature': atm.temperature,
+        'pressure': atm.pressure,
+        'density': atm.density,
+        'speed_of_sound': atm.speed_of_sound,
+    }
+
+
+def mach_numbers(soa: Dict[str, np.ndarray]) -> np.ndarray:
+    """Mach number for every condition in a SoA bundle"""
+    return soa['airspeed'] / soa['speed_of_sound']
+
+
+def dynamic_pressures(soa: Dict[str, np.ndarray]) -> np.ndarray:
+    """Dynamic pressure for every condition in a SoA bundle"""
+    return 0.5 * soa['density'] * soa['airspeed']**2
+
+
+def equivalent_airspeeds(soa: Dict[str, np.ndarray]) -> np.ndarray:
+    """Equivalent airspeed for every condition in a SoA bundle"""
+    return soa['airspeed'] * np.sqrt(soa['density'] / 1.225)
 
 
 def create_test_conditions() -> List[FlightConditions]:
@@ -6,7 +6,6 @@ including range, endurance, climb performance, and optimization.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 from typing import Dict, List, Tuple, Optional
 
 # Handle imports for both package and direct execution
@@ -99,17 +98,10 @@ class PerformanceAnalyzer:
         Returns:
             Optimal angle of attack in degrees
         """
+        # One fused sweep over the grid instead of 100 scalar L/D calls
         angles = np.linspace(-5, 20, 100)
-        best_ld = 0
-        best_angle = 0
-        
-        for angle in angles:
-            ld_ratio = self.aircraft.calculate_lift_drag_ratio(angle)
-            if ld_ratio > best_ld:
-                best_ld = ld_ratio
-                best_angle = angle
-                
-        return best_angle
+        _, _, ld_ratios = self.aircraft.calculate_aero_sweep(angles)
+        return float(angles[np.argmax(ld_ratios)])
     
     def calculate_climb_performance(self, altitude_range: Tuple[float, float], 
                                   weight: float, thrust_available: float) -> Dict:
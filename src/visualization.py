@@ -65,12 +65,39 @@ class AircraftVisualizer:
         self.aircraft = aircraft
         self.analyzer = PerformanceAnalyzer(aircraft)
         self._aircraft_folder = None
-    
+        self._cache = None
+
     def set_output_folder(self, folder_path: str):
         """Set the output folder for this aircraft's visualizations."""
         self._aircraft_folder = folder_path
         os.makedirs(folder_path, exist_ok=True)
-        
+
+    def _precompute(self) -> Dict:
+        """
+        Lazily compute and cache the sweep data shared by the plot methods.
+
+        The drag polar, L/D, and V-n plots all evaluate the same AoA grid
+        and optimal point; computing them once per visualizer means each
+        additional plot only pays for drawing.
+        """
+        if self._cache is None:
+            angles = np.linspace(-5, 20, 100)
+            cl_values, cd_values, ld_ratios = self.aircraft.calculate_aero_sweep(angles)
+            best_aoa = self.analyzer.find_optimal_angle_of_attack()
+            self._cache = {
+                'angles': angles,
+                'cl_values': cl_values,
+                'cd_values': cd_values,
+                'ld_ratios': ld_ratios,
+                'best_aoa': best_aoa,
+                'best_cl': self.aircraft.calculate_lift_coefficient(best_aoa),
+                'best_ld': self.aircraft.calculate_lift_drag_ratio(best_aoa),
+                'envelope': FlightEnvelope(self.aircraft),
+            }
+            self._cache['best_cd'] = self.aircraft.calculate_drag_coefficient(
+                self._cache['best_cl'])
+        return self._cache
+
     def plot_drag_polar(self, save_path: Optional[str] = None) -> plt.Figure:
         """
         Plot aircraft drag polar (CL vs CD)
@@ -81,16 +108,10 @@ class AircraftVisualizer:
         Returns:
             Matplotlib figure
         """
-        angles = np.linspace(-5, 20, 100)
-        cl_values = []
-        cd_values = []
-        
-        for angle in angles:
-            cl = self.aircraft.calculate_lift_coefficient(angle)
-            cd = self.aircraft.calculate_drag_coefficient(cl)
-            cl_values.append(cl)
-            cd_values.append(cd)
-        
+        cache = self._precompute()
+        cl_values = cache['cl_values']
+        cd_values = cache['cd_values']
+
         fig, ax = plt.subplots(figsize=(10, 8))
         ax.plot(cd_values, cl_values, 'b-', linewidth=2, label=self.aircraft.name)
         ax.grid(True, alpha=0.3)
@@ -100,9 +121,9 @@ class AircraftVisualizer:
         ax.legend()
         
         # Add annotations for key points
-        best_aoa = self.analyzer.find_optimal_angle_of_attack()
-        best_cl = self.aircraft.calculate_lift_coefficient(best_aoa)
-        best_cd = self.aircraft.calculate_drag_coefficient(best_cl)
+        best_aoa = cache['best_aoa']
+        best_cl = cache['best_cl']
+        best_cd = cache['best_cd']
         ax.plot(best_cd, best_cl, 'ro', markersize=8, label=f'Max L/D (α={best_aoa:.1f}°)')
         ax.annotate(f'Max L/D\n({best_cd:.3f}, {best_cl:.3f})', 
                    xy=(best_cd, best_cl), xytext=(best_cd+0.005, best_cl+0.1),
@@ -129,20 +150,12 @@ class AircraftVisualizer:
         Returns:
             Matplotlib figure
         """
-        angles = np.linspace(-5, 20, 100)
-        cl_values = []
-        cd_values = []
-        ld_ratios = []
-        
-        for angle in angles:
-            cl = self.aircraft.calculate_lift_coefficient(angle)
-            cd = self.aircraft.calculate_drag_coefficient(cl)
-            ld = cl / cd if cd > 0 else 0
-            
-            cl_values.append(cl)
-            cd_values.append(cd)
-            ld_ratios.append(ld)
-        
+        cache = self._precompute()
+        angles = cache['angles']
+        cl_values = cache['cl_values']
+        cd_values = cache['cd_values']
+        ld_ratios = cache['ld_ratios']
+
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
         
         # Top plot: CL and CD vs AoA
@@ -165,8 +178,8 @@ class AircraftVisualizer:
         ax2.set_xlim(-5, 20)
         
         # Mark optimal point
-        best_aoa = self.analyzer.find_optimal_angle_of_attack()
-        best_ld = self.aircraft.calculate_lift_drag_ratio(best_aoa)
+        best_aoa = cache['best_aoa']
+        best_ld = cache['best_ld']
         ax2.plot(best_aoa, best_ld, 'ro', markersize=8)
         ax2.annotate(f'Max L/D\n({best_aoa:.1f}°, {best_ld:.1f})', 
                     xy=(best_aoa, best_ld), xytext=(best_aoa+2, best_ld+2),
@@ -196,7 +209,7 @@ class AircraftVisualizer:
         Returns:
             Matplotlib figure
         """
-        envelope = FlightEnvelope(self.aircraft)
+        envelope = self._precompute()['envelope']
         velocities, load_factors = envelope.generate_v_n_diagram(altitude, weight)
         
         fig, ax = plt.subplots(figsize=(12, 8))